@@ -1,21 +1,55 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta
+from functools import lru_cache
+import json
 import logging
 import os
 import re
 import time
-from typing import Iterable, Optional, Sequence
-from urllib.parse import parse_qs, quote_plus, urljoin, urlparse
+from typing import Callable, Iterable, Iterator, Optional, Sequence
+from urllib.parse import parse_qsl, quote_plus, urljoin, urlparse
 
 import feedparser
+import lxml  # noqa: F401  # BeautifulSoup(..., "lxml") needs it; fail at import, not mid-crawl
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
 
-from .database import get_conn
+from .database import get_conn, insert_articles
 
 logger = logging.getLogger(__name__)
 
+_RE_DATE = re.compile(r"\b(\d{4})\s*\.\s*(\d{2})\s*\.\s*(\d{2})\s*\.?\b")
+_RE_SPLIT = re.compile(r"[|\u00b7\n]")
+_RE_BRACKET = re.compile(r"\[[^\]]+\]\s*")
+_RE_WS = re.compile(r"\s+")
+_RE_JSONLD_DATE = re.compile(r'"datePublished"\s*:\s*"([^"]+)"')
+_RE_DAYS_AGO = re.compile(r"(\d+)\s*일\s*전")
+_RE_IBOSS_CATEGORY = re.compile(r"/ab-(\d+)")
+_RE_IBOSS_ANY_ARTICLE = re.compile(r"/ab-\d+-\d+")
+
+_KEYWORD_FETCH_WORKERS = 8
+_SUMMARY_FETCH_WORKERS = 4
+_DETAIL_FETCH_WORKERS = 8
+# Articles kept per source crawl run.
+_MAX_ROWS_PER_SOURCE = 50
+
+
+def _build_session() -> requests.Session:
+    # One pooled session keeps TCP/TLS connections alive across fetches;
+    # the pool is sized for the crawler's thread pools.
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; yong2/0.1)"})
+    return session
+
+
+_SESSION = _build_session()
+
 
 def _parse_published(entry) -> Optional[str]:
     if getattr(entry, "published_parsed", None):
@@ -29,25 +63,43 @@ def _parse_published(entry) -> Optional[str]:
 
 def _fetch_summary(url: str) -> str:
     try:
-        resp = requests.get(url, timeout=10)
+        resp = _SESSION.get(url, timeout=10)
         resp.raise_for_status()
     except requests.RequestException:
         return ""
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    soup = BeautifulSoup(resp.text, "lxml")
     meta = soup.find("meta", attrs={"name": "description"})
     if meta and meta.get("content"):
         return meta["content"].strip()
     return ""
 
 
+def _fetch_summary_cached(url: str, cache: dict[str, str]) -> str:
+    # The same article URL often shows up under several keywords. Each crawl
+    # run passes its own dict, so overlapping runs never evict each other's
+    # entries and nothing outlives the run.
+    summary = cache.get(url)
+    if summary is None:
+        summary = cache[url] = _fetch_summary(url)
+    return summary
+
+
 def _iter_entries(rss_url: str) -> Iterable[object]:
-    feed = feedparser.parse(rss_url)
+    # Fetch through the shared session (keep-alive) and let feedparser only
+    # parse; feedparser's own fetch never raised, so errors yield no entries.
+    try:
+        resp = _SESSION.get(rss_url, timeout=10)
+        resp.raise_for_status()
+    except requests.RequestException:
+        return []
+    feed = feedparser.parse(resp.content)
     return feed.entries or []
 
 
 def crawl_rss(rss_url: str) -> int:
-    inserted = 0
+    summary_cache: dict[str, str] = {}
+    rows: list[tuple] = []
     with get_conn() as conn:
         for entry in _iter_entries(rss_url):
             title = (getattr(entry, "title", "") or "").strip()
@@ -56,25 +108,10 @@ def crawl_rss(rss_url: str) -> int:
                 continue
             summary = (getattr(entry, "summary", "") or "").strip()
             if not summary:
-                summary = _fetch_summary(url)
+                summary = _fetch_summary_cached(url, summary_cache)
             published_at = _parse_published(entry)
-
-            cur = conn.execute(
-                "SELECT 1 FROM articles WHERE url = ?",
-                (url,),
-            )
-            if cur.fetchone():
-                continue
-            conn.execute(
-                """
-                INSERT INTO articles (title, url, summary, published_at)
-                VALUES (?, ?, ?, ?)
-                """,
-                (title, url, summary, published_at),
-            )
-            inserted += 1
-        conn.commit()
-    return inserted
+            rows.append((None, title, url, summary, None, published_at))
+        return insert_articles(conn, rows)
 
 
 def crawl_keyword_news(
@@ -87,103 +124,165 @@ def crawl_keyword_news(
     if not keywords:
         return {"inserted": 0, "bookmarked": 0, "keywords": 0}
 
+    summary_cache: dict[str, str] = {}
     inserted = 0
     bookmarked = 0
     today = date.today()
-    created_at = datetime.utcnow().isoformat()
     source_set = {s.strip().lower() for s in (sources or []) if s.strip()}
     if not source_set:
         source_set = {"google"}
 
+    targets = []
+    for keyword in keywords:
+        raw_keyword = str(keyword.get("keyword") or "").strip()
+        keyword_norm = str(keyword.get("keyword_norm") or "").strip()
+        if raw_keyword and keyword_norm:
+            targets.append((raw_keyword, keyword_norm))
+
     with get_conn() as conn:
-        for keyword in keywords:
-            raw_keyword = str(keyword.get("keyword") or "").strip()
-            keyword_norm = str(keyword.get("keyword_norm") or "").strip()
-            if not raw_keyword or not keyword_norm:
-                continue
-            seen_urls: set[str] = set()
-            seen_titles: set[str] = set()
-            collected = 0
-            if "google" in source_set:
-                rss_url = _google_news_rss_url(raw_keyword)
-                for entry in _iter_entries(rss_url):
-                    title = (getattr(entry, "title", "") or "").strip()
-                    url = (getattr(entry, "link", "") or "").strip()
-                    if not title or not url:
-                        continue
-                    url = _normalize_google_news_url(url)
-                    if url in seen_urls:
-                        continue
-                    press = _extract_google_press(entry, title)
-                    display_title = _format_title_with_press(title, press)
-                    title_key = _normalize_title_for_dedupe(display_title)
-                    if title_key in seen_titles:
-                        continue
-                    seen_urls.add(url)
-                    seen_titles.add(title_key)
-
-                    published_at = _parse_published(entry)
-                    if not _is_within_days(published_at, today, days=days):
-                        continue
-                    summary = (getattr(entry, "summary", "") or "").strip()
-                    if not summary:
-                        summary = _fetch_summary(url)
-
-                    keyword_article_id, is_new = _upsert_keyword_article(
-                        conn,
-                        raw_keyword,
-                        keyword_norm,
-                        display_title,
-                        url,
-                        summary,
-                        published_at,
-                    )
-                    if is_new:
-                        inserted += 1
-                    collected += 1
-                    if collected >= max_items_per_keyword:
-                        break
-
-            if "naver" in source_set and collected < max_items_per_keyword:
-                for item in _iter_naver_news_items(raw_keyword):
-                    title = (item.get("title") or "").strip()
-                    url = (item.get("url") or "").strip()
-                    press = (item.get("press") or "").strip()
-                    if not title or not url:
-                        continue
-                    if url in seen_urls:
-                        continue
-                    display_title = _format_title_with_press(title, press)
-                    title_key = _normalize_title_for_dedupe(display_title)
-                    if title_key in seen_titles:
-                        continue
-                    seen_urls.add(url)
-                    seen_titles.add(title_key)
-                    published_at = item.get("published_at")
-                    if not _is_within_days(published_at, today, days=days):
-                        continue
-                    summary = (item.get("summary") or "").strip()
-                    if not summary:
-                        summary = _fetch_summary(url)
-                    keyword_article_id, is_new = _upsert_keyword_article(
-                        conn,
-                        raw_keyword,
-                        keyword_norm,
-                        display_title,
-                        url,
-                        summary,
-                        published_at,
-                    )
-                    if is_new:
-                        inserted += 1
-                    collected += 1
-                    if collected >= max_items_per_keyword:
-                        break
-        conn.commit()
+        known_urls = {row[0] for row in conn.execute("SELECT url FROM keyword_articles")}
+
+    # Network fetches run in parallel; the DB writes below stay on one thread/connection.
+    with ThreadPoolExecutor(max_workers=_KEYWORD_FETCH_WORKERS) as pool:
+        gathered = list(
+            pool.map(
+                lambda target: _gather_keyword_items(
+                    target[0],
+                    source_set=source_set,
+                    today=today,
+                    days=days,
+                    max_items=max_items_per_keyword,
+                    known_urls=known_urls,
+                    summary_cache=summary_cache,
+                ),
+                targets,
+            )
+        )
+
+    rows = [
+        (
+            raw_keyword,
+            keyword_norm,
+            item["title"],
+            item["url"],
+            item["summary"] or raw_keyword,
+            None,
+            item["published_at"],
+        )
+        for (raw_keyword, keyword_norm), items in zip(targets, gathered)
+        for item in items
+    ]
+    if rows:
+        with get_conn() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                """
+                INSERT INTO keyword_articles
+                  (keyword, keyword_norm, title, url, summary, image_url, published_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO NOTHING
+                """,
+                rows,
+            )
+            conn.commit()
+            inserted = conn.total_changes - before
 
     return {"inserted": inserted, "bookmarked": bookmarked, "keywords": len(keywords)}
 
 
+def _gather_keyword_items(
+    raw_keyword: str,
+    *,
+    source_set: set[str],
+    today: date,
+    days: int,
+    max_items: int,
+    known_urls: set[str],
+    summary_cache: dict[str, str],
+) -> list[dict]:
+    items: list[dict] = []
+    seen_urls: set[str] = set()
+    seen_titles: set[str] = set()
+    if "google" in source_set:
+        rss_url = _google_news_rss_url(raw_keyword)
+        for entry in _iter_entries(rss_url):
+            title = (getattr(entry, "title", "") or "").strip()
+            url = (getattr(entry, "link", "") or "").strip()
+            if not title or not url:
+                continue
+            url = _normalize_google_news_url(url)
+            if url in seen_urls:
+                continue
+            press = _extract_google_press(entry, title)
+            display_title = _format_title_with_press(title, press)
+            title_key = _normalize_title_for_dedupe(display_title)
+            if title_key in seen_titles:
+                continue
+            seen_urls.add(url)
+            seen_titles.add(title_key)
+
+            published_at = _parse_published(entry)
+            if not _is_within_days(published_at, today, days=days):
+                continue
+            items.append(
+                {
+                    "title": display_title,
+                    "url": url,
+                    "summary": (getattr(entry, "summary", "") or "").strip(),
+                    "published_at": published_at,
+                }
+            )
+            if len(items) >= max_items:
+                break
+
+    if "naver" in source_set and len(items) < max_items:
+        for item in _iter_naver_news_items(raw_keyword):
+            title = (item.get("title") or "").strip()
+            url = (item.get("url") or "").strip()
+            press = (item.get("press") or "").strip()
+            if not title or not url:
+                continue
+            if url in seen_urls:
+                continue
+            display_title = _format_title_with_press(title, press)
+            title_key = _normalize_title_for_dedupe(display_title)
+            if title_key in seen_titles:
+                continue
+            seen_urls.add(url)
+            seen_titles.add(title_key)
+            published_at = item.get("published_at")
+            if not _is_within_days(published_at, today, days=days):
+                continue
+            items.append(
+                {
+                    "title": display_title,
+                    "url": url,
+                    "summary": (item.get("summary") or "").strip(),
+                    "published_at": published_at,
+                }
+            )
+            if len(items) >= max_items:
+                break
+
+    # Known URLs still count toward max_items (as before) but are dropped
+    # here so they never trigger a summary fetch or an insert attempt.
+    items = [item for item in items if item["url"] not in known_urls]
+    _fill_missing_summaries(items, summary_cache)
+    return items
+
+
+def _fill_missing_summaries(items: list[dict], summary_cache: dict[str, str]) -> None:
+    missing = [item for item in items if not item["summary"]]
+    if not missing:
+        return
+    with ThreadPoolExecutor(max_workers=_SUMMARY_FETCH_WORKERS) as pool:
+        summaries = pool.map(
+            lambda url: _fetch_summary_cached(url, summary_cache), [item["url"] for item in missing]
+        )
+        for item, summary in zip(missing, summaries):
+            item["summary"] = summary
+
+
 def crawl_source(source: dict) -> int:
     source_id = (source.get("id") or "").strip()
     start_url = source.get("start_url")
@@ -201,34 +300,32 @@ def crawl_source(source: dict) -> int:
 def crawl_yozm_it(start_urls: Sequence[str], source_id: str) -> int:
     items: list[dict] = []
     seen = set()
-    for start_url in start_urls:
-        try:
-            html = _fetch_html(start_url)
-        except requests.RequestException:
-            # Skip a list page if the remote host closes the connection.
-            continue
-        soup = BeautifulSoup(html, "html.parser")
-        for item in _extract_yozm_list_items(soup, start_url):
+    with ThreadPoolExecutor(max_workers=_DETAIL_FETCH_WORKERS) as pool:
+        pages = list(pool.map(_fetch_yozm_list_page, start_urls))
+    for page_items in pages:
+        for item in page_items:
             url = item.get("url")
             if not url or url in seen:
                 continue
             seen.add(url)
             items.append(item)
 
-    inserted = 0
+    rows: list[tuple] = []
     today = date.today()
     max_links = 200
     with get_conn() as conn:
-        for item in items[:max_links]:
+        for item, details in _with_prefetched_details(
+            _pending_list_items(conn, items[:max_links], today),
+            _fetch_yozm_detail,
+        ):
             url = item["url"]
-            detail = {}
             title = (item.get("title") or "").strip()
             summary = (item.get("summary") or "").strip()
             image_url = (item.get("image_url") or "").strip() or None
             published_at = item.get("published_at")
 
             if not published_at or not title or not summary or not image_url:
-                detail = _fetch_yozm_detail(url)
+                detail = details.get(url) or {}
                 title = detail.get("title") or title
                 summary = detail.get("summary") or summary
                 image_url = detail.get("image_url") or image_url
@@ -238,36 +335,24 @@ def crawl_yozm_it(start_urls: Sequence[str], source_id: str) -> int:
                 continue
             if not _is_within_days(published_at, today, days=30):
                 continue
-            cur = conn.execute("SELECT 1 FROM articles WHERE url = ?", (url,))
-            if cur.fetchone():
-                continue
-            conn.execute(
-                """
-                INSERT INTO articles (source_id, title, url, summary, image_url, published_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (source_id, title, url, summary, image_url, published_at),
-            )
-            inserted += 1
-            if inserted >= 50:
+            rows.append((source_id, title, url, summary, image_url, published_at))
+            if len(rows) >= _MAX_ROWS_PER_SOURCE:
                 break
-        conn.commit()
-    return inserted
+        return insert_articles(conn, rows)
 
 
 def crawl_i_boss(start_url: str, source_id: str) -> int:
     html = _fetch_html_with_retry(start_url, source_id=source_id, stage="list", attempts=3)
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
 
     items = _extract_iboss_list_items(soup, start_url)
 
-    inserted = 0
+    rows: list[tuple] = []
     today = date.today()
     max_links = 200
     with get_conn() as conn:
-        for item in items[:max_links]:
+        for item in _pending_list_items(conn, items[:max_links], today):
             url = item["url"]
-            detail = {}
             title = (item.get("title") or "").strip()
             summary = (item.get("summary") or "").strip()
             image_url = (item.get("image_url") or "").strip() or None
@@ -284,26 +369,78 @@ def crawl_i_boss(start_url: str, source_id: str) -> int:
                 continue
             if not _is_within_days(published_at, today, days=30):
                 continue
-            cur = conn.execute("SELECT 1 FROM articles WHERE url = ?", (url,))
-            if cur.fetchone():
-                continue
-            conn.execute(
-                """
-                INSERT INTO articles (source_id, title, url, summary, image_url, published_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (source_id, title, url, summary, image_url, published_at),
-            )
-            inserted += 1
-            if inserted >= 50:
+            rows.append((source_id, title, url, summary, image_url, published_at))
+            if len(rows) >= _MAX_ROWS_PER_SOURCE:
                 break
-        conn.commit()
-    return inserted
+        return insert_articles(conn, rows)
+
+
+def _fetch_yozm_list_page(start_url: str) -> list[dict]:
+    try:
+        html = _fetch_html(start_url)
+    except requests.RequestException:
+        # Skip a list page if the remote host closes the connection.
+        return []
+    soup = BeautifulSoup(html, "lxml")
+    return _extract_yozm_list_items(soup, start_url)
+
+
+def _pending_list_items(conn, items: Sequence[dict], today: date) -> list[dict]:
+    # Drop already-stored URLs and cards whose listing date is already out of
+    # range before any detail page (or ScrapingBee call) is requested.
+    known = _known_urls(conn, "articles", [item["url"] for item in items])
+    return [
+        item
+        for item in items
+        if item["url"] not in known
+        and (not item.get("published_at") or _is_within_days(item["published_at"], today, days=30))
+    ]
+
+
+def _known_urls(conn, table: str, urls: Sequence[str], chunk_size: int = 500) -> set[str]:
+    known: set[str] = set()
+    unique_urls = list(dict.fromkeys(urls))
+    for start in range(0, len(unique_urls), chunk_size):
+        chunk = unique_urls[start : start + chunk_size]
+        placeholders = ",".join("?" for _ in chunk)
+        cur = conn.execute(f"SELECT url FROM {table} WHERE url IN ({placeholders})", chunk)
+        known.update(row[0] for row in cur.fetchall())
+    return known
+
+
+def _with_prefetched_details(
+    items: Sequence[dict],
+    fetch_detail: Callable[[str], dict],
+) -> Iterator[tuple[dict, dict[str, dict]]]:
+    # Fetch details one worker-sized batch at a time; the next batch is only
+    # requested once the caller has consumed this one, so breaking out of the
+    # loop (e.g. at the row cap) stops further detail requests.
+    for start in range(0, len(items), _DETAIL_FETCH_WORKERS):
+        batch = items[start : start + _DETAIL_FETCH_WORKERS]
+        details = _prefetch_details(batch, fetch_detail)
+        for item in batch:
+            yield item, details
+
+
+def _prefetch_details(items: Sequence[dict], fetch_detail: Callable[[str], dict]) -> dict[str, dict]:
+    urls = [
+        item["url"]
+        for item in items
+        if not (
+            item.get("published_at")
+            and (item.get("title") or "").strip()
+            and (item.get("summary") or "").strip()
+            and (item.get("image_url") or "").strip()
+        )
+    ]
+    if not urls:
+        return {}
+    with ThreadPoolExecutor(max_workers=_DETAIL_FETCH_WORKERS) as pool:
+        return dict(zip(urls, pool.map(fetch_detail, urls)))
 
 
 def _fetch_html(url: str) -> str:
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; yong2/0.1)"}
-    resp = requests.get(url, headers=headers, timeout=10)
+    resp = _SESSION.get(url, timeout=10)
     resp.raise_for_status()
     return resp.text
 
@@ -316,13 +453,12 @@ def _fetch_html_with_retry(
     attempts: int = 3,
     backoff_seconds: float = 1.0,
 ) -> str:
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; yong2/0.1)"}
     use_proxy = source_id == "i_boss" and bool(os.getenv("SCRAPINGBEE_API_KEY", "").strip())
     proxy_url = os.getenv("SCRAPINGBEE_API_URL", "https://app.scrapingbee.com/api/v1/")
     for attempt in range(1, attempts + 1):
         try:
             if use_proxy:
-                resp = requests.get(
+                resp = _SESSION.get(
                     proxy_url,
                     params={
                         "api_key": os.getenv("SCRAPINGBEE_API_KEY", "").strip(),
@@ -331,11 +467,10 @@ def _fetch_html_with_retry(
                         "premium_proxy": "true",
                         "country_code": "kr",
                     },
-                    headers=headers,
                     timeout=20,
                 )
             else:
-                resp = requests.get(url, headers=headers, timeout=10)
+                resp = _SESSION.get(url, timeout=10)
             resp.raise_for_status()
             return resp.text
         except requests.RequestException as exc:
@@ -366,20 +501,7 @@ def _fetch_yozm_detail(url: str) -> dict:
         html = _fetch_html(url)
     except requests.RequestException:
         return {}
-
-    soup = BeautifulSoup(html, "html.parser")
-    title = _meta_content(soup, "og:title") or _meta_content(soup, "twitter:title")
-    summary = _meta_content(soup, "description") or _meta_content(soup, "og:description")
-    image_url = _meta_content(soup, "og:image") or _meta_content(soup, "twitter:image")
-
-    published_at = _extract_date_from_json_ld(soup) or _extract_date_near_title(soup) or _extract_date_anywhere(soup)
-
-    return {
-        "title": (title or "").strip(),
-        "summary": (summary or "").strip(),
-        "image_url": (image_url or "").strip() or None,
-        "published_at": published_at,
-    }
+    return _parse_detail_html(html)
 
 
 def _fetch_generic_detail(url: str) -> dict:
@@ -387,17 +509,7 @@ def _fetch_generic_detail(url: str) -> dict:
         html = _fetch_html(url)
     except requests.RequestException:
         return {}
-    soup = BeautifulSoup(html, "html.parser")
-    title = _meta_content(soup, "og:title") or _meta_content(soup, "twitter:title") or _meta_content(soup, "title")
-    summary = _meta_content(soup, "description") or _meta_content(soup, "og:description")
-    image_url = _meta_content(soup, "og:image") or _meta_content(soup, "twitter:image")
-    published_at = _extract_date_from_json_ld(soup) or _extract_date_near_title(soup) or _extract_date_anywhere(soup)
-    return {
-        "title": (title or "").strip(),
-        "summary": (summary or "").strip(),
-        "image_url": (image_url or "").strip() or None,
-        "published_at": published_at,
-    }
+    return _parse_detail_html(html)
 
 
 def _fetch_generic_detail_with_retry(url: str, *, source_id: str) -> dict:
@@ -405,12 +517,16 @@ def _fetch_generic_detail_with_retry(url: str, *, source_id: str) -> dict:
         html = _fetch_html_with_retry(url, source_id=source_id, stage="detail", attempts=3)
     except requests.RequestException:
         return {}
+    return _parse_detail_html(html)
 
-    soup = BeautifulSoup(html, "html.parser")
-    title = _meta_content(soup, "og:title") or _meta_content(soup, "twitter:title") or _meta_content(soup, "title")
-    summary = _meta_content(soup, "description") or _meta_content(soup, "og:description")
-    image_url = _meta_content(soup, "og:image") or _meta_content(soup, "twitter:image")
-    published_at = _extract_date_from_json_ld(soup) or _extract_date_near_title(soup) or _extract_date_anywhere(soup)
+
+def _parse_detail_html(html: str) -> dict:
+    soup = BeautifulSoup(html, "lxml")
+    metas = _meta_map(soup)
+    title = metas.get("og:title") or metas.get("twitter:title") or metas.get("title")
+    summary = metas.get("description") or metas.get("og:description")
+    image_url = metas.get("og:image") or metas.get("twitter:image")
+    published_at = _extract_published_at(soup)
     return {
         "title": (title or "").strip(),
         "summary": (summary or "").strip(),
@@ -419,23 +535,30 @@ def _fetch_generic_detail_with_retry(url: str, *, source_id: str) -> dict:
     }
 
 
-def _meta_content(soup: BeautifulSoup, key: str) -> Optional[str]:
-    if key.startswith("og:") or key.startswith("twitter:"):
-        tag = soup.find("meta", property=key)
-    else:
-        tag = soup.find("meta", attrs={"name": key})
-    if tag and tag.get("content"):
-        return tag["content"]
-    return None
+def _meta_map(soup: BeautifulSoup) -> dict[str, str]:
+    # Single pass over <meta> tags. og:/twitter: keys come from `property`,
+    # everything else from `name`. Tags with empty content are skipped, so the
+    # first non-empty value for a key wins (previously the first matching tag
+    # won even when its content was empty, hiding a later populated duplicate).
+    metas: dict[str, str] = {}
+    for tag in soup.find_all("meta"):
+        content = tag.get("content")
+        if not content:
+            continue
+        prop = tag.get("property") or ""
+        if prop.startswith(("og:", "twitter:")):
+            metas.setdefault(prop, content)
+        name = tag.get("name")
+        if name and not name.startswith(("og:", "twitter:")):
+            metas.setdefault(name, content)
+    return metas
 
 
 def _extract_yozm_list_items(soup: BeautifulSoup, start_url: str) -> list[dict]:
     items = []
     seen = set()
-    for a in soup.select("a[href]"):
+    for a in soup.select("a[href*='/magazine/detail/']"):
         href = a.get("href", "")
-        if "/magazine/detail/" not in href:
-            continue
         url = urljoin(start_url, href)
         if url in seen:
             continue
@@ -459,10 +582,8 @@ def _extract_iboss_list_items(soup: BeautifulSoup, start_url: str) -> list[dict]
     items = []
     seen = set()
     pattern = _iboss_article_pattern(start_url)
-    for a in soup.select("a[href]"):
+    for a in soup.find_all("a", href=pattern):
         href = a.get("href", "")
-        if not pattern.search(href):
-            continue
         url = urljoin(start_url, href)
         if url in seen:
             continue
@@ -482,12 +603,13 @@ def _extract_iboss_list_items(soup: BeautifulSoup, start_url: str) -> list[dict]
     return items
 
 
+@lru_cache(maxsize=32)
 def _iboss_article_pattern(start_url: str) -> re.Pattern:
-    match = re.search(r"/ab-(\d+)", start_url)
+    match = _RE_IBOSS_CATEGORY.search(start_url)
     if match:
         category = match.group(1)
         return re.compile(rf"/ab-{category}-\d+")
-    return re.compile(r"/ab-\d+-\d+")
+    return _RE_IBOSS_ANY_ARTICLE
 
 
 def _text_or_alt(tag) -> str:
@@ -519,7 +641,7 @@ def _extract_card_fields(card, base_url: str) -> tuple[str, Optional[str], Optio
 def _first_non_date_sentence(text: str) -> str:
     if not text:
         return ""
-    parts = [p.strip() for p in re.split(r"[|\u00b7\n]", text) if p.strip()]
+    parts = [p.strip() for p in _RE_SPLIT.split(text) if p.strip()]
     for part in parts:
         if _parse_date_text(part):
             continue
@@ -528,53 +650,99 @@ def _first_non_date_sentence(text: str) -> str:
     return text.strip()
 
 
-def _extract_date_from_json_ld(soup: BeautifulSoup) -> Optional[str]:
-    for tag in soup.find_all("script", attrs={"type": "application/ld+json"}):
+def _extract_published_at(soup: BeautifulSoup) -> Optional[str]:
+    # One walk collects JSON-LD scripts and the first <h1>; the full-page
+    # text is only built if neither yields a date.
+    json_ld_tags = []
+    h1 = None
+    for tag in soup.find_all(["script", "h1"]):
+        if tag.name == "h1":
+            if h1 is None:
+                h1 = tag
+        elif tag.get("type") == "application/ld+json":
+            json_ld_tags.append(tag)
+
+    published_at = _extract_date_from_json_ld(json_ld_tags)
+    if published_at:
+        return published_at
+    if h1 is not None:
+        container = h1.parent or h1
+        published_at = _parse_date_text(container.get_text(" ", strip=True))
+        if published_at:
+            return published_at
+    return _parse_date_text(soup.get_text(" ", strip=True))
+
+
+def _extract_date_from_json_ld(tags: Iterable) -> Optional[str]:
+    for tag in tags:
         raw = tag.string or ""
-        match = re.search(r'"datePublished"\s*:\s*"([^"]+)"', raw)
-        if not match:
+        if '"datePublished"' not in raw:
+            continue
+        try:
+            value = _find_json_key(json.loads(raw), "datePublished")
+        except ValueError:
+            match = _RE_JSONLD_DATE.search(raw)
+            value = match.group(1) if match else None
+        if not isinstance(value, str):
             continue
-        value = match.group(1)
         try:
             dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
             return dt.date().isoformat()
         except ValueError:
             continue
     return None
-def _extract_date_near_title(soup: BeautifulSoup) -> Optional[str]:
-    h1 = soup.find("h1")
-    if not h1:
-        return None
-    container = h1.parent or h1
-    text = container.get_text(" ", strip=True)
-    return _parse_date_text(text)
 
 
-def _extract_date_anywhere(soup: BeautifulSoup) -> Optional[str]:
-    text = soup.get_text(" ", strip=True)
-    return _parse_date_text(text)
+def _find_json_key(data, key: str):
+    # Depth-first search so @graph / nested arrays are handled.
+    if isinstance(data, dict):
+        if key in data:
+            return data[key]
+        children = data.values()
+    elif isinstance(data, list):
+        children = data
+    else:
+        return None
+    for child in children:
+        value = _find_json_key(child, key)
+        if value is not None:
+            return value
+    return None
 
 
 def _parse_date_text(text: str) -> Optional[str]:
-    match = re.search(r"\b(\d{4})\s*\.\s*(\d{2})\s*\.\s*(\d{2})\s*\.?\b", text)
+    match = _RE_DATE.search(text)
     if not match:
         return None
-    dt = datetime.strptime(f"{match.group(1)}.{match.group(2)}.{match.group(3)}", "%Y.%m.%d")
-    return dt.date().isoformat()
+    try:
+        return date(int(match.group(1)), int(match.group(2)), int(match.group(3))).isoformat()
+    except ValueError:
+        return None
 
 
 def _is_within_days(value: Optional[str], today: date, days: int) -> bool:
     if not value:
         return False
+    published = _date_ordinal(value)
+    if published is None:
+        return False
+    end = today.toordinal()
+    return end - days + 1 <= published <= end
+
+
+@lru_cache(maxsize=4096)
+def _date_ordinal(value: str) -> Optional[int]:
+    # Accepts YYYY-MM-DD[...] and YYYY.MM.DD; shape is checked up front so
+    # the common path never raises.
+    if len(value) < 10 or value[4] not in "-." or value[7] != value[4]:
+        return None
+    year, month, day = value[0:4], value[5:7], value[8:10]
+    if not (year.isdigit() and month.isdigit() and day.isdigit()):
+        return None
     try:
-        published = datetime.fromisoformat(value).date()
+        return date(int(year), int(month), int(day)).toordinal()
     except ValueError:
-        try:
-            published = datetime.strptime(value, "%Y.%m.%d").date()
-        except ValueError:
-            return False
-    start = today - timedelta(days=days - 1)
-    return start <= published <= today
+        return None
 
 
 def _normalize_start_urls(start_url) -> list[str]:
@@ -593,38 +761,6 @@ def _normalize_start_urls(start_url) -> list[str]:
     return []
 
 
-def _upsert_keyword_article(
-    conn,
-    keyword: str,
-    keyword_norm: str,
-    title: str,
-    url: str,
-    summary: str,
-    published_at: Optional[str],
-) -> tuple[int, bool]:
-    cur = conn.execute("SELECT id FROM keyword_articles WHERE url = ?", (url,))
-    row = cur.fetchone()
-    if row:
-        return row[0], False
-    cur = conn.execute(
-        """
-        INSERT INTO keyword_articles
-          (keyword, keyword_norm, title, url, summary, image_url, published_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
-        (
-            keyword,
-            keyword_norm,
-            title,
-            url,
-            summary or keyword,
-            None,
-            published_at,
-        ),
-    )
-    return cur.lastrowid, True
-
-
 def _bookmark_keyword_article(conn, keyword_article_id: int, created_at: str) -> None:
     conn.execute(
         """
@@ -642,7 +778,7 @@ def _iter_naver_news_items(keyword: str) -> Iterable[dict]:
         html = _fetch_html(url)
     except requests.RequestException:
         return []
-    soup = BeautifulSoup(html, "html.parser")
+    soup = BeautifulSoup(html, "lxml")
     items: list[dict] = []
     for a in soup.select("a.news_tit"):
         href = (a.get("href") or "").strip()
@@ -682,7 +818,7 @@ def _parse_relative_date(text: str) -> Optional[str]:
     if not text:
         return None
     now = date.today()
-    match = re.search(r"(\d+)\s*일\s*전", text)
+    match = _RE_DAYS_AGO.search(text)
     if match:
         days = int(match.group(1))
         return (now - timedelta(days=days)).isoformat()
@@ -710,8 +846,8 @@ def _format_title_with_press(title: str, press: str) -> str:
 
 
 def _normalize_title_for_dedupe(title: str) -> str:
-    cleaned = re.sub(r"\[[^\]]+\]\s*", "", title)
-    cleaned = re.sub(r"\s+", " ", cleaned).strip().lower()
+    cleaned = _RE_BRACKET.sub("", title)
+    cleaned = _RE_WS.sub(" ", cleaned).strip().lower()
     return cleaned
 
 
@@ -721,11 +857,12 @@ def _google_news_rss_url(keyword: str) -> str:
 
 
 def _normalize_google_news_url(url: str) -> str:
+    if "url=" not in url:
+        return url
     try:
-        parsed = urlparse(url)
-        qs = parse_qs(parsed.query)
-        if "url" in qs and qs["url"]:
-            return qs["url"][0]
+        for key, value in parse_qsl(urlparse(url).query):
+            if key == "url" and value:
+                return value
     except Exception:
         return url
     return url
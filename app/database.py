@@ -1,24 +1,51 @@
+import atexit
 import os
+import queue
 import sqlite3
+import threading
 from contextlib import contextmanager
 from pathlib import Path
+from typing import Sequence
 
 
 _ROOT = Path(__file__).resolve().parent.parent
 _DEFAULT_DB = _ROOT / "data" / "news.db"
 DB_PATH = Path(os.environ.get("NEWS_DB_PATH", str(_DEFAULT_DB)))
+_SCHEMA_VERSION = 4
+# Idle connections kept for reuse; bursts beyond this open extra connections
+# that are closed on release instead of being pooled.
+_POOL_SIZE = int(os.environ.get("SQLITE_POOL_SIZE", "8"))
+_pool: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue()
+_pool_lock = threading.Lock()
+_open_count = 0
+
+
+# WAL lets page reads proceed while a crawl is writing. Some environments
+# restrict SQLite's file locking/journaling; set SQLITE_JOURNAL_MODE=MEMORY
+# there to use an in-memory journal and avoid disk I/O errors.
+_JOURNAL_MODE = os.environ.get("SQLITE_JOURNAL_MODE", "WAL")
+_CONNECTION_PRAGMAS = (
+    f"PRAGMA journal_mode={_JOURNAL_MODE}",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=OFF",
+)
 
 
 def _configure(conn: sqlite3.Connection) -> None:
-    # Some environments restrict SQLite's default file locking/journaling.
-    # Use an in-memory journal to avoid disk I/O errors.
-    conn.execute("PRAGMA journal_mode=MEMORY")
+    for pragma in _CONNECTION_PRAGMAS:
+        conn.execute(pragma)
 
 
 def init_db() -> None:
     DB_PATH.parent.mkdir(parents=True, exist_ok=True)
     with sqlite3.connect(DB_PATH) as conn:
         _configure(conn)
+        # Bump _SCHEMA_VERSION whenever the DDL below changes.
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= _SCHEMA_VERSION:
+            return
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS articles (
@@ -91,6 +118,15 @@ def init_db() -> None:
             )
             """
         )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sources (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                logo_url TEXT
+            )
+            """
+        )
         _ensure_columns(
             conn,
             "articles",
@@ -108,6 +144,42 @@ def init_db() -> None:
                 "is_auto": "INTEGER DEFAULT 0",
             },
         )
+        # Feed queries order by (published_at DESC, id DESC) with a LIMIT.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_articles_pub_id ON articles(published_at DESC, id DESC)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_keyword_articles_pub_id "
+            "ON keyword_articles(published_at DESC, id DESC)"
+        )
+        # /bookmarks reads live bookmarks newest first; partial indexes keep
+        # removed rows out and cover the join key.
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_bookmarks_live_created "
+            "ON bookmarks(created_at DESC, article_id) WHERE removed_at IS NULL"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_keyword_bookmarks_live_created "
+            "ON keyword_bookmarks(created_at DESC, keyword_article_id) WHERE removed_at IS NULL"
+        )
+        conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+
+def insert_articles(conn: sqlite3.Connection, rows: Sequence[tuple]) -> int:
+    """Insert (source_id, title, url, summary, image_url, published_at) rows,
+    skipping URLs already stored, and commit. Returns the number inserted."""
+    if not rows:
+        return 0
+    before = conn.total_changes
+    conn.executemany(
+        """
+        INSERT OR IGNORE INTO articles (source_id, title, url, summary, image_url, published_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        """,
+        rows,
+    )
+    conn.commit()
+    return conn.total_changes - before
 
 
 def _ensure_columns(conn: sqlite3.Connection, table: str, columns: dict) -> None:
@@ -119,11 +191,62 @@ def _ensure_columns(conn: sqlite3.Connection, table: str, columns: dict) -> None
         conn.execute(f"ALTER TABLE {table} ADD COLUMN {name} {col_type}")
 
 
+def _connect() -> sqlite3.Connection:
+    global _open_count
+    # Pooled connections move between request/worker threads, but only one
+    # thread holds a connection at a time. sqlite3 keeps compiled statements
+    # per connection keyed by SQL text, so reused connections skip re-preparing
+    # the hot queries; the headroom covers chunked IN (...) variants too.
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False, cached_statements=256)
+    _configure(conn)
+    with _pool_lock:
+        _open_count += 1
+    return conn
+
+
+def _discard(conn: sqlite3.Connection) -> None:
+    global _open_count
+    conn.close()
+    with _pool_lock:
+        _open_count -= 1
+
+
 @contextmanager
 def get_conn():
-    conn = sqlite3.connect(DB_PATH)
     try:
-        _configure(conn)
+        conn = _pool.get_nowait()
+    except queue.Empty:
+        conn = _connect()
+    try:
         yield conn
     finally:
-        conn.close()
+        # Closing used to discard uncommitted work; keep that behaviour.
+        if conn.in_transaction:
+            conn.rollback()
+        if _pool.qsize() < _POOL_SIZE:
+            _pool.put(conn)
+        else:
+            _discard(conn)
+
+
+def optimize_db() -> None:
+    # Cheap when nothing changed; refreshes planner stats after bulk inserts.
+    with get_conn() as conn:
+        conn.execute("PRAGMA optimize")
+
+
+def pool_stats() -> dict:
+    idle = _pool.qsize()
+    with _pool_lock:
+        open_count = _open_count
+    return {"open": open_count, "idle": idle, "in_use": open_count - idle, "max_idle": _POOL_SIZE}
+
+
+@atexit.register
+def close_pool() -> None:
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            return
+        _discard(conn)
@@ -1,26 +1,73 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import json
 import logging
 import os
 import re
-from datetime import datetime, timedelta
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from html import escape
 from pathlib import Path
-from typing import Dict, List, Optional
-from urllib.parse import urlparse
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException, Form
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Form, Request
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import HTMLResponse, RedirectResponse, Response, StreamingResponse
 from pydantic import BaseModel, AnyUrl
 
 from .crawler import crawl_keyword_news, crawl_source
-from .database import get_conn, init_db
+from .database import close_pool, get_conn, init_db, insert_articles, optimize_db, pool_stats
 from .source_registry import get_source_by_id, load_sources
 
 
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_SPACE_RE = re.compile(r"\s+")
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+
+
+def _minify_css(css: str) -> str:
+    """Drop comments and insignificant whitespace; selectors keep their spaces."""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = _CSS_SPACE_RE.sub(" ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = css.replace(": ", ":").replace(";}", "}")
+    return css.strip()
+
+
+class _GZipMiddleware(GZipMiddleware):
+    # Starlette matches "gzip" as a substring, so "gzip;q=0" would still get a
+    # compressed body. Drop a refused gzip from the request's Accept-Encoding
+    # first so the middleware and the routes see the same answer.
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            raw = dict(scope["headers"]).get(b"accept-encoding", b"").decode("latin-1")
+            if "gzip" in raw and not _accepts_gzip(raw):
+                headers = [(k, v) for k, v in scope["headers"] if k != b"accept-encoding"]
+                scope = {**scope, "headers": headers}
+        await super().__call__(scope, receive, send)
+
+
 app = FastAPI(title="News Curation MVP")
+# Card HTML and feed JSON are highly repetitive; level 6 keeps CPU cost low.
+app.add_middleware(_GZipMiddleware, minimum_size=500, compresslevel=6)
 logger = logging.getLogger(__name__)
 _ROOT = Path(__file__).resolve().parent.parent
+_STATIC_DIR = Path(__file__).resolve().parent / "static"
+# app.css stays readable on disk; the served copy is minified once at import.
+_STYLES_CSS = _minify_css((_STATIC_DIR / "app.css").read_text(encoding="utf-8")).encode("utf-8")
+_STYLES_CSS_GZIP = gzip.compress(_STYLES_CSS, compresslevel=9, mtime=0)
+_STYLES_VERSION = hashlib.sha256(_STYLES_CSS).hexdigest()[:12]
+_STYLES_ETAG = f'"css-{_STYLES_VERSION}"'
+_STYLES_ETAG_GZIP = f'"css-{_STYLES_VERSION}-gz"'
+_STYLESHEET_LINK = f'<link rel="stylesheet" href="/static/app.css?v={_STYLES_VERSION}" />'
+# Lets a CDN/proxy that supports it turn the header into a 103 Early Hint.
+_STYLESHEET_PRELOAD = f"</static/app.css?v={_STYLES_VERSION}>; rel=preload; as=style"
 _MANUAL_IBOSS_PATH = Path(
     os.environ.get("MANUAL_IBOSS_PATH", str(_ROOT / "data" / "iboss_manual.json"))
 )
@@ -53,6 +100,62 @@ _KEYWORD_NEWS_SOURCES = [
     if s.strip()
 ]
 _PRUNE_UNBOOKMARKED_DAYS = int(os.environ.get("PRUNE_UNBOOKMARKED_DAYS", "0"))
+_CRAWL_ALL_WORKERS = int(os.environ.get("CRAWL_ALL_WORKERS", "4"))
+_CRAWL_JOBS_KEPT = 20
+_crawl_jobs: "OrderedDict[str, dict]" = OrderedDict()
+_crawl_jobs_lock = threading.Lock()
+_PAGE_CACHE_SIZE = 16
+_page_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_page_cache_lock = threading.Lock()
+_startup_sync_done = threading.Event()
+_TAG_KEYWORDS: Dict[str, Tuple[str, ...]] = {
+    "기획": ("기획", "plan", "planning", "pm", "po", "roadmap", "strategy", "okr"),
+    "디자인": ("디자인", "ux", "ui", "design", "prototype"),
+    "개발": ("개발", "dev", "engineering", "code", "backend", "frontend", "api"),
+    "AI": ("ai", "llm", "model", "inference", "agent"),
+    "마케팅": ("마케팅", "marketing", "ad", "campaign", "brand", "performance"),
+    "비즈니스": ("비즈니스", "business", "b2b", "b2c", "revenue", "growth"),
+    "프로덕트": ("프로덕트", "product", "feature", "launch", "retention", "activation"),
+    "커리어": ("커리어", "career", "hiring", "interview", "leadership"),
+    "트렌드": ("트렌드", "trend", "market", "outlook", "report"),
+    "스타트업": ("스타트업", "startup", "founder", "seed", "venture"),
+}
+_PM_KEYWORDS: Tuple[str, ...] = (
+    "기획",
+    "프로덕트",
+    "product",
+    "pm",
+    "po",
+    "로드맵",
+    "roadmap",
+    "전략",
+    "launch",
+    "strategy",
+    "okr",
+    "고객",
+    "customer",
+    "지표",
+    "metric",
+    "실험",
+    "experiment",
+)
+_LOGO_URLS: Dict[str, str] = {
+    "yozm_it": "https://upload.wikimedia.org/wikipedia/commons/9/92/%EC%9A%94%EC%A6%98IT_%EB%A1%9C%EA%B3%A0.png",
+    "i_boss": "https://cdn.ibos.kr/images/iboss_home_logo.svg",
+    "keyword_news": "https://www.gstatic.com/images/branding/product/1x/googleg_32dp.png",
+}
+_NETLOC_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*://([^/?#]*)")
+_WHITESPACE_RE = re.compile(r"\s+")
+_RECOMMENDED_TAGS = frozenset({"기획", "프로덕트", "비즈니스", "트렌드"})
+
+
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    # Plain substring alternation, matched against already-lowered text.
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+_TAG_PATTERNS = tuple((tag, _keyword_pattern(keywords)) for tag, keywords in _TAG_KEYWORDS.items())
+_PM_KEYWORD_PATTERN = _keyword_pattern(_PM_KEYWORDS)
 
 
 class ArticleOut(BaseModel):
@@ -85,6 +188,7 @@ class CrawlIn(BaseModel):
 @app.on_event("startup")
 def on_startup() -> None:
     init_db()
+    _sync_sources_table()
     _ensure_default_keywords()
     sync_result = sync_manual_iboss_articles()
     logger.info(
@@ -93,251 +197,208 @@ def on_startup() -> None:
         sync_result["inserted"],
         sync_result["path"],
     )
-    for result in sync_startup_sources():
-        if result.get("error"):
-            logger.warning(
-                "[startup_source_sync_failed] source_id=%s error=%s",
+    # Network crawls can take minutes; serve what is already stored meanwhile.
+    threading.Thread(target=_run_startup_source_sync, name="startup-source-sync", daemon=True).start()
+
+
+def _run_startup_source_sync() -> None:
+    try:
+        for result in sync_startup_sources():
+            if result.get("error"):
+                logger.warning(
+                    "[startup_source_sync_failed] source_id=%s error=%s",
+                    result.get("source_id"),
+                    result.get("error"),
+                )
+                continue
+            logger.info(
+                "[startup_source_sync] source_id=%s inserted=%s",
                 result.get("source_id"),
-                result.get("error"),
+                result.get("inserted", 0),
             )
-            continue
-        logger.info(
-            "[startup_source_sync] source_id=%s inserted=%s",
-            result.get("source_id"),
-            result.get("inserted", 0),
-        )
+        optimize_db()
+    finally:
+        _startup_sync_done.set()
+
+
+@app.on_event("shutdown")
+def on_shutdown() -> None:
+    close_pool()
+
+
+@app.get("/static/app.css", include_in_schema=False)
+def stylesheet(request: Request) -> Response:
+    # The link carries ?v=<content hash>, so clients may cache it forever.
+    headers = {"Cache-Control": "public, max-age=31536000, immutable"}
+    body, etag = _STYLES_CSS, _STYLES_ETAG
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        # Pre-compressed at import; GZipMiddleware passes encoded bodies through
+        # untouched, so Vary is ours to set here (it adds it on the plain path).
+        body, etag = _STYLES_CSS_GZIP, _STYLES_ETAG_GZIP
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    headers["ETag"] = etag
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="text/css", headers=headers)
+
+
+@app.get("/healthz")
+def healthz() -> dict:
+    return {"ok": True, "startup_sync_done": _startup_sync_done.is_set()}
+
+
+@app.get("/pool-health")
+def pool_health() -> dict:
+    return pool_stats()
 
 
 @app.get("/news", response_model=List[ArticleOut])
-def list_news(limit: int = 50) -> List[ArticleOut]:
-    source_names = _source_name_map()
+def list_news(request: Request, response: Response, limit: int = 50):
+    with get_conn() as conn:
+        etag = _feed_etag(conn)
+    not_modified = _check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
     rows = _fetch_feed_rows(limit)
-    return [
-        ArticleOut(
-            id=row[0],
-            source_id=row[1],
-            source_name=_display_source_name(row[1], row[3], source_names),
-            title=row[2],
-            url=row[3],
-            summary=row[4],
-            image_url=row[5],
-            published_at=row[6],
-        )
+    # Rows come from our own tables, so skip per-field model validation and
+    # encode once; response_model still documents the schema.
+    payload = [
+        {
+            "id": row[0],
+            "source_id": row[1],
+            "source_name": _display_source_name(row[1], row[3], row[7]),
+            "title": row[2],
+            "url": row[3],
+            "summary": row[4],
+            "image_url": row[5],
+            "published_at": row[6],
+        }
         for row in rows
     ]
+    return Response(
+        json.dumps(payload, ensure_ascii=False, separators=(",", ":")),
+        media_type="application/json",
+        headers=dict(response.headers),
+    )
 
 
 @app.get("/", response_class=HTMLResponse)
-def home(limit: int = 50) -> str:
-    source_names = _source_name_map()
-    rows = _fetch_feed_rows(limit)
+def home(request: Request, response: Response, limit: int = 50):
+    with get_conn() as conn:
+        etag = _feed_etag(conn)
+    not_modified = _check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return _render_articles_page(
+        response,
+        "/",
+        (limit, etag),
+        lambda: _fetch_feed_rows(limit),
+        _feed_card,
+        "No articles yet.",
+    )
 
-    cards = []
-    for article_id, source_id, title, url, summary, image_url, published_at in rows:
-        source_label = _display_source_name(source_id, url, source_names)
-        logo_url = _source_logo_url(source_id)
-        tags = _infer_tags(title, summary, source_id)
-        tags_html = "".join(f'<span class="tag">{tag}</span>' for tag in tags)
-        recommended = _is_recommended(title, summary, tags)
-        rec_html = '<span class="badge">추천</span>' if recommended else ""
-        bookmark_action = f"/bookmark/{article_id}"
-        bookmark_label = "찜"
-        if source_id == "keyword_news":
-            bookmark_action = f"/keyword-bookmark/{article_id}"
-            bookmark_label = "찜"
-        remove_action = f"/bookmark/{article_id}/remove"
-        if source_id == "keyword_news":
-            remove_action = f"/keyword-bookmark/{article_id}/remove"
-        if logo_url:
-            avatar_html = (
-                '<div class="logo-wrap">'
-                f'<img class="logo" src="{logo_url}" alt="{source_label} logo" loading="lazy" '
-                'onerror="this.parentElement.classList.add(\'is-broken\');" />'
-                f'<div class="logo-fallback">{source_label[:1].upper() if source_label else "?"}</div>'
-                "</div>"
-            )
-        else:
-            initial = (source_label[:1] or "?").upper()
-            avatar_html = f'<div class="avatar avatar--placeholder" aria-hidden="true">{initial}</div>'
-        if image_url:
-            media_html = (
-                '<div class="media">'
-                f'<img src="{image_url}" alt="" loading="lazy" '
-                'onerror="this.parentElement.classList.add(\'is-broken\');" />'
-                f'<div class="media__ph">{source_label}</div>'
-                "</div>"
-            )
-        else:
-            media_html = f'<div class="media media--placeholder">{source_label}</div>'
-        cards.append(
-            f"""
-            <article class="card">
-              <header class="card__header">
-                {avatar_html}
-                <div class="meta">
-                  <div class="source">{source_label}</div>
-                  <div class="date">{published_at or ""}</div>
-                </div>
-                {'' if not bookmark_action else f'<form class="bookmark" method="post" action="{bookmark_action}"><button type="submit">{bookmark_label}</button></form>'}
-              </header>
-              <div class="tags">{tags_html}{rec_html}</div>
-              <h2 class="title">
-                <a href="{url}" target="_blank" rel="noopener noreferrer">{title}</a>
-              </h2>
-              <p class="summary">{summary or ""}</p>
-              {media_html}
-            </article>
-            """
-        )
 
-    body = "\n".join(cards) if cards else "<p class=\"empty\">No articles yet.</p>"
-    return f"""
-    <html lang="ko">
-      <head>
-        <meta name="viewport" content="width=device-width, initial-scale=1" />
-        <title>뉴스</title>
-        <style>
-          { _inline_shared_styles() }
-        </style>
-      </head>
-      <body>
-        <div class="topbar">
-          <ul class="menu">
-            <li class="active">수집 기사 목록</li>
-            <li><a href="/bookmarks">찜한 기사</a></li>
-            <li><a href="/settings">설정</a></li>
-          </ul>
-        </div>
-        <div class="container">
-          { _render_trend_bars() }
-          <div class="grid">{body}</div>
+@app.get("/bookmarks", response_class=HTMLResponse)
+def bookmarks(request: Request, response: Response, limit: int = 100):
+    with get_conn() as conn:
+        etag = _bookmarks_etag(conn)
+    not_modified = _check_etag(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+    return _render_articles_page(
+        response,
+        "/bookmarks",
+        (limit, etag),
+        lambda: _fetch_bookmark_rows(limit),
+        _bookmark_card,
+        "No bookmarks yet.",
+    )
+
+
+_PAGES = (
+    ("/", "수집 기사 목록", "뉴스"),
+    ("/bookmarks", "찜한 기사", "북마크"),
+    ("/settings", "설정", "설정"),
+)
+_PAGE_TAIL = """
         </div>
       </body>
     </html>
     """
 
 
-@app.get("/bookmarks", response_class=HTMLResponse)
-def bookmarks(limit: int = 100) -> str:
-    source_names = _source_name_map()
-    with get_conn() as conn:
-        cur = conn.execute(
-            """
-            SELECT id, title, url, summary, image_url, published_at, source_id
-            FROM (
-              SELECT a.id AS id,
-                     a.title AS title,
-                     a.url AS url,
-                     a.summary AS summary,
-                     a.image_url AS image_url,
-                     a.published_at AS published_at,
-                     a.source_id AS source_id,
-                     b.created_at AS created_at
-              FROM bookmarks b
-              JOIN articles a ON a.id = b.article_id
-              WHERE b.removed_at IS NULL
-              UNION ALL
-              SELECT k.id AS id,
-                     k.title AS title,
-                     k.url AS url,
-                     k.summary AS summary,
-                     k.image_url AS image_url,
-                     k.published_at AS published_at,
-                     'keyword_news' AS source_id,
-                     kb.created_at AS created_at
-              FROM keyword_bookmarks kb
-              JOIN keyword_articles k ON k.id = kb.keyword_article_id
-              WHERE kb.removed_at IS NULL
-            )
-            ORDER BY created_at DESC
-            LIMIT ?
-            """,
-            (limit,),
-        )
-        rows = cur.fetchall()
-
-    cards = []
-    for article_id, title, url, summary, image_url, published_at, source_id in rows:
-        source_label = _display_source_name(source_id, url, source_names)
-        logo_url = _source_logo_url(source_id)
-        tags = _infer_tags(title, summary, source_id)
-        tags_html = "".join(f'<span class="tag">{tag}</span>' for tag in tags)
-        recommended = _is_recommended(title, summary, tags)
-        rec_html = '<span class="badge">추천</span>' if recommended else ""
-        remove_action = f"/bookmark/{article_id}/remove"
-        if logo_url:
-            avatar_html = (
-                '<div class="logo-wrap">'
-                f'<img class="logo" src="{logo_url}" alt="{source_label} logo" loading="lazy" '
-                'onerror="this.parentElement.classList.add(\'is-broken\');" />'
-                f'<div class="logo-fallback">{source_label[:1].upper() if source_label else "?"}</div>'
-                "</div>"
-            )
-        else:
-            initial = (source_label[:1] or "?").upper()
-            avatar_html = f'<div class="avatar avatar--placeholder" aria-hidden="true">{initial}</div>'
-        if image_url:
-            media_html = (
-                '<div class="media">'
-                f'<img src="{image_url}" alt="" loading="lazy" '
-                'onerror="this.parentElement.classList.add(\'is-broken\');" />'
-                f'<div class="media__ph">{source_label}</div>'
-                "</div>"
-            )
+@lru_cache(maxsize=None)
+def _render_page_head(active_path: str) -> str:
+    """Document head, top menu and the opening container shared by every page."""
+    menu = []
+    title = ""
+    for path, label, page_title in _PAGES:
+        if path == active_path:
+            title = page_title
+            menu.append(f'<li class="active">{label}</li>')
         else:
-            media_html = f'<div class="media media--placeholder">{source_label}</div>'
-        cards.append(
-            f"""
-            <article class="card">
-              <header class="card__header">
-                {avatar_html}
-                <div class="meta">
-                  <div class="source">{source_label}</div>
-                  <div class="date">{published_at or ""}</div>
-                </div>
-                <form class="bookmark" method="post" action="{remove_action}">
-                  <button type="submit">제거</button>
-                </form>
-              </header>
-              <div class="tags">{tags_html}{rec_html}</div>
-              <h2 class="title">
-                <a href="{url}" target="_blank" rel="noopener noreferrer">{title}</a>
-              </h2>
-              <p class="summary">{summary or ""}</p>
-              {media_html}
-            </article>
-            """
-        )
-
-    body = "\n".join(cards) if cards else "<p class=\"empty\">No bookmarks yet.</p>"
+            menu.append(f'<li><a href="{path}">{label}</a></li>')
     return f"""
     <html lang="ko">
       <head>
         <meta name="viewport" content="width=device-width, initial-scale=1" />
-        <title>북마크</title>
-        <style>
-          { _inline_shared_styles() }
-        </style>
+        <title>{title}</title>
+        { _STYLESHEET_LINK }
       </head>
       <body>
         <div class="topbar">
           <ul class="menu">
-            <li><a href="/">수집 기사 목록</a></li>
-            <li class="active">찜한 기사</li>
-            <li><a href="/settings">설정</a></li>
+            {"".join(menu)}
           </ul>
         </div>
         <div class="container">
-          { _render_trend_bars() }
-          <div class="grid">{body}</div>
-        </div>
-      </body>
-    </html>
     """
 
 
+def _render_articles_page(
+    response: Response,
+    active_path: str,
+    version: tuple,
+    fetch_rows: Callable[[], List[tuple]],
+    render_card: Callable[[tuple], str],
+    empty_msg: str,
+) -> Response:
+    response.headers["Link"] = _STYLESHEET_PRELOAD
+    # Keyed by the page's ETag, so any write that changes the page misses.
+    cache_key = (active_path, *version)
+    with _page_cache_lock:
+        cached = _page_cache.get(cache_key)
+    if cached is not None:
+        return HTMLResponse(cached, headers=dict(response.headers))
+
+    # Flush the shell first so the browser fetches CSS while rows are queried.
+    def chunks() -> Iterator[str]:
+        head = _render_page_head(active_path) + _TREND_BARS_HTML + '<div class="grid">'
+        yield head
+        try:
+            body = "".join(render_card(row) for row in fetch_rows()) or f'<p class="empty">{empty_msg}</p>'
+        except Exception:
+            # Status 200 is already sent; close the page with an error instead
+            # of cutting it off, and leave it out of the cache.
+            logger.exception("[page_render_failed] path=%s", active_path)
+            yield '<p class="empty">Failed to load articles. Please try again.</p></div>' + _PAGE_TAIL
+            return
+        rest = body + "</div>" + _PAGE_TAIL
+        yield rest
+        with _page_cache_lock:
+            _page_cache[cache_key] = head + rest
+            _page_cache.move_to_end(cache_key)
+            while len(_page_cache) > _PAGE_CACHE_SIZE:
+                _page_cache.popitem(last=False)
+
+    return StreamingResponse(chunks(), media_type="text/html; charset=utf-8", headers=dict(response.headers))
+
+
 @app.get("/settings", response_class=HTMLResponse)
-def settings() -> str:
+def settings(response: Response) -> str:
+    response.headers["Link"] = _STYLESHEET_PRELOAD
     keywords = _list_keywords()
     active_rows = []
     inactive_rows = []
@@ -355,7 +416,7 @@ def settings() -> str:
             items.append(
                 f"""
                 <li class="keyword-item">
-                  <span class="keyword-text">{row["keyword"]}</span>
+                  <span class="keyword-text">{escape(row["keyword"])}</span>
                   <form method="post" action="/settings/keyword/{row["id"]}/remove">
                     <button type="submit">제거</button>
                   </form>
@@ -367,24 +428,7 @@ def settings() -> str:
     active_html = render_list(active_rows)
     inactive_html = render_list(inactive_rows)
 
-    return f"""
-    <html lang="ko">
-      <head>
-        <meta name="viewport" content="width=device-width, initial-scale=1" />
-        <title>설정</title>
-        <style>
-          { _inline_shared_styles() }
-        </style>
-      </head>
-      <body>
-        <div class="topbar">
-          <ul class="menu">
-            <li><a href="/">수집 기사 목록</a></li>
-            <li><a href="/bookmarks">찜한 기사</a></li>
-            <li class="active">설정</li>
-          </ul>
-        </div>
-        <div class="container">
+    return _render_page_head("/settings") + f"""
           <div class="panel">
             <h2>키워드 설정</h2>
             <form class="keyword-form" method="post" action="/settings/keyword">
@@ -400,10 +444,7 @@ def settings() -> str:
             <h3 class="mt">비활성 키워드</h3>
             {inactive_html}
           </div>
-        </div>
-      </body>
-    </html>
-    """
+    """ + _PAGE_TAIL
 
 
 @app.post("/settings/keyword")
@@ -411,7 +452,7 @@ def add_keyword(keyword: str = Form(...)) -> RedirectResponse:
     normalized = _normalize_keyword(keyword)
     if not normalized:
         return RedirectResponse(url="/settings", status_code=303)
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
     with get_conn() as conn:
         conn.execute(
             """
@@ -430,7 +471,7 @@ def add_keyword(keyword: str = Form(...)) -> RedirectResponse:
 
 @app.post("/settings/keyword/{keyword_id}/remove")
 def remove_keyword(keyword_id: int) -> RedirectResponse:
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
     with get_conn() as conn:
         cur = conn.execute(
             "SELECT keyword_norm FROM keyword_settings WHERE id = ?",
@@ -455,21 +496,18 @@ def remove_keyword(keyword_id: int) -> RedirectResponse:
 
 @app.post("/feedback", response_model=FeedbackOut)
 def create_feedback(payload: FeedbackIn) -> FeedbackOut:
+    created_at = _utc_now_iso()
     with get_conn() as conn:
-        cur = conn.execute(
-            "SELECT 1 FROM articles WHERE id = ?",
-            (payload.article_id,),
-        )
-        if not cur.fetchone():
-            raise HTTPException(status_code=404, detail="Article not found")
-        created_at = datetime.utcnow().isoformat()
         cur = conn.execute(
             """
             INSERT INTO feedback (article_id, is_like, created_at)
-            VALUES (?, ?, ?)
+            SELECT ?, ?, ?
+            WHERE EXISTS (SELECT 1 FROM articles WHERE id = ?)
             """,
-            (payload.article_id, 1 if payload.is_like else 0, created_at),
+            (payload.article_id, int(payload.is_like), created_at, payload.article_id),
         )
+        if cur.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Article not found")
         conn.commit()
         feedback_id = cur.lastrowid
 
@@ -520,38 +558,109 @@ def crawl_keywords_now() -> RedirectResponse:
     return RedirectResponse(url="/settings", status_code=303)
 
 
-@app.post("/crawl-all")
-def crawl_all() -> dict:
-    sources = load_sources()
-    results = []
-    failed = 0
-    for source in sources:
-        source_id = str(source.get("id") or "").strip()
-        if not source_id:
-            continue
-        if source_id == "i_boss" and _IBOSS_MANUAL_ONLY:
-            results.append({"source_id": source_id, "skipped": "manual_only"})
-            continue
-        try:
-            count = crawl_source(source)
-            results.append({"source_id": source_id, "inserted": count})
-        except Exception as exc:
-            failed += 1
-            results.append(
-                {
-                    "source_id": source_id,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                }
-            )
-    keyword_result = crawl_keyword_news(
-        _active_keywords(),
-        days=_KEYWORD_NEWS_DAYS,
-        max_items_per_keyword=_KEYWORD_NEWS_MAX_ITEMS,
-        sources=_KEYWORD_NEWS_SOURCES,
-    )
-    results.append({"source_id": "keyword_news", **keyword_result})
+@app.post("/crawl-all", status_code=202)
+def crawl_all(background_tasks: BackgroundTasks) -> dict:
+    job_id, status, created = _claim_crawl_job()
+    if created:
+        background_tasks.add_task(_run_crawl_all_job, job_id)
+    return {
+        "job_id": job_id,
+        "status": status,
+        "status_url": f"/crawl-all/{job_id}",
+        "already_running": not created,
+    }
+
+
+@app.get("/crawl-all/{job_id}")
+def crawl_all_status(job_id: str) -> dict:
+    with _crawl_jobs_lock:
+        job = _crawl_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="job_id not found")
+    return {"job_id": job_id, **job}
+
+
+def _claim_crawl_job() -> Tuple[str, str, bool]:
+    # One crawl-all at a time: a cron hit or click during a run gets that run's job_id.
+    with _crawl_jobs_lock:
+        for job_id, job in reversed(_crawl_jobs.items()):
+            if job["status"] in ("queued", "running"):
+                return job_id, job["status"], False
+        job_id = uuid.uuid4().hex
+        _store_crawl_job(job_id, {"status": "queued"})
+    return job_id, "queued", True
+
+
+def _set_crawl_job(job_id: str, state: dict) -> None:
+    with _crawl_jobs_lock:
+        _store_crawl_job(job_id, state)
+
+
+def _store_crawl_job(job_id: str, state: dict) -> None:
+    # Caller holds _crawl_jobs_lock.
+    _crawl_jobs[job_id] = state
+    _crawl_jobs.move_to_end(job_id)
+    while len(_crawl_jobs) > _CRAWL_JOBS_KEPT:
+        _crawl_jobs.popitem(last=False)
+
+
+def _run_crawl_all_job(job_id: str) -> None:
+    _set_crawl_job(job_id, {"status": "running"})
+    try:
+        result = run_crawl_all()
+    except Exception as exc:
+        logger.exception("[crawl_all_failed] job_id=%s", job_id)
+        _set_crawl_job(job_id, {"status": "failed", "error": str(exc), "error_type": type(exc).__name__})
+        return
+    _set_crawl_job(job_id, {"status": "done", **result})
+
+
+def _crawl_one_source(source: dict) -> dict:
+    source_id = str(source.get("id") or "").strip()
+    if source_id == "i_boss" and _IBOSS_MANUAL_ONLY:
+        return {"source_id": source_id, "skipped": "manual_only"}
+    try:
+        return {"source_id": source_id, "inserted": crawl_source(source)}
+    except Exception as exc:
+        return {
+            "source_id": source_id,
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+        }
+
+
+def _crawl_keyword_source() -> dict:
+    try:
+        keyword_result = crawl_keyword_news(
+            _active_keywords(),
+            days=_KEYWORD_NEWS_DAYS,
+            max_items_per_keyword=_KEYWORD_NEWS_MAX_ITEMS,
+            sources=_KEYWORD_NEWS_SOURCES,
+        )
+    except Exception as exc:
+        return {"source_id": "keyword_news", "error": str(exc), "error_type": type(exc).__name__}
+    return {"source_id": "keyword_news", **keyword_result}
+
+
+def run_crawl_all() -> dict:
+    # Sources are independent network-bound crawls, so overlap them;
+    # wall time becomes the slowest source instead of the sum.
+    # Pick up sources.yaml edits (names) without a restart; load_sources is mtime-cached.
+    _sync_sources_table()
+    # keyword_news is listed in sources.yaml for its name/logo but has no
+    # crawl_source handler; _crawl_keyword_source covers it.
+    sources = [
+        s
+        for s in load_sources()
+        if str(s.get("id") or "").strip() and str(s.get("id")).strip() != "keyword_news"
+    ]
+    with ThreadPoolExecutor(max_workers=max(1, _CRAWL_ALL_WORKERS)) as pool:
+        keyword_future = pool.submit(_crawl_keyword_source)
+        results = list(pool.map(_crawl_one_source, sources))
+        results.append(keyword_future.result())
+    failed = sum(1 for r in results if "error" in r)
     pruned = _prune_unbookmarked_articles(_PRUNE_UNBOOKMARKED_DAYS)
+    optimize_db()
     return {
         "results": results,
         "failed": failed,
@@ -571,7 +680,7 @@ def sync_manual_iboss_articles() -> dict:
         return {"path": str(path), "loaded": 0, "inserted": 0}
 
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = json.loads(path.read_bytes())
     except Exception as exc:
         logger.warning("[manual_iboss_sync_failed] path=%s error=%s", path, repr(exc))
         return {"path": str(path), "loaded": 0, "inserted": 0, "error": str(exc)}
@@ -583,82 +692,79 @@ def sync_manual_iboss_articles() -> dict:
     else:
         raw_articles = []
 
-    inserted = 0
+    rows: List[tuple] = []
     loaded = 0
-    with get_conn() as conn:
-        for item in raw_articles:
-            if not isinstance(item, dict):
-                continue
-            title = str(item.get("title") or "").strip()
-            url = str(item.get("url") or "").strip()
-            summary = str(item.get("summary") or "").strip()
-            image_url = str(item.get("image_url") or "").strip() or None
-            published_at = str(item.get("published_at") or "").strip() or None
+    for item in raw_articles:
+        if not isinstance(item, dict):
+            continue
+        title = str(item.get("title") or "").strip()
+        url = str(item.get("url") or "").strip()
+        summary = str(item.get("summary") or "").strip()
+        image_url = str(item.get("image_url") or "").strip() or None
+        published_at = str(item.get("published_at") or "").strip() or None
 
-            if not title or not url or not summary:
-                continue
-            loaded += 1
-            cur = conn.execute("SELECT 1 FROM articles WHERE url = ?", (url,))
-            if cur.fetchone():
-                continue
-            conn.execute(
-                """
-                INSERT INTO articles (source_id, title, url, summary, image_url, published_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                ("i_boss", title, url, summary, image_url, published_at),
-            )
-            inserted += 1
-        conn.commit()
+        if not title or not url or not summary:
+            continue
+        loaded += 1
+        rows.append(("i_boss", title, url, summary, image_url, published_at))
+
+    # articles.url is UNIQUE, so OR IGNORE skips known and repeated URLs.
+    with get_conn() as conn:
+        inserted = insert_articles(conn, rows)
     return {"path": str(path), "loaded": loaded, "inserted": inserted}
 
 
 def sync_startup_sources() -> List[dict]:
     if not _STARTUP_CRAWL_SOURCE_IDS:
         return []
-    results: List[dict] = []
-    for source_id in _STARTUP_CRAWL_SOURCE_IDS:
-        if source_id == "i_boss" and _IBOSS_MANUAL_ONLY:
-            results.append({"source_id": source_id, "skipped": "manual_only"})
-            continue
-        try:
-            source = get_source_by_id(source_id)
-            inserted = crawl_source(source)
-            results.append({"source_id": source_id, "inserted": inserted})
-        except Exception as exc:
-            results.append(
-                {
-                    "source_id": source_id,
-                    "error": str(exc),
-                    "error_type": type(exc).__name__,
-                }
-            )
-    return results
+    with ThreadPoolExecutor(max_workers=max(1, _CRAWL_ALL_WORKERS)) as pool:
+        return list(pool.map(_crawl_startup_source, _STARTUP_CRAWL_SOURCE_IDS))
+
+
+def _crawl_startup_source(source_id: str) -> dict:
+    if source_id == "i_boss" and _IBOSS_MANUAL_ONLY:
+        return {"source_id": source_id, "skipped": "manual_only"}
+    try:
+        source = get_source_by_id(source_id)
+    except Exception as exc:
+        return {
+            "source_id": source_id,
+            "error": str(exc),
+            "error_type": type(exc).__name__,
+        }
+    return _crawl_one_source(source)
+
+
+def _utc_now_iso() -> str:
+    # Same naive-UTC ISO text the TEXT timestamp columns already hold, so
+    # created_at/removed_at keep sorting correctly against existing rows.
+    return datetime.now(timezone.utc).replace(tzinfo=None).isoformat()
 
 
 def _normalize_keyword(keyword: str) -> str:
-    cleaned = re.sub(r"\s+", " ", keyword.strip())
+    cleaned = _WHITESPACE_RE.sub(" ", keyword.strip())
     return cleaned.lower()
 
 
 def _ensure_default_keywords() -> None:
-    now = datetime.utcnow().isoformat()
+    now = _utc_now_iso()
+    rows = [
+        (keyword, normalized, now, now)
+        for keyword in _DEFAULT_KEYWORDS
+        if (normalized := _normalize_keyword(keyword))
+    ]
     with get_conn() as conn:
-        for keyword in _DEFAULT_KEYWORDS:
-            normalized = _normalize_keyword(keyword)
-            if not normalized:
-                continue
-            conn.execute(
-                """
-                INSERT INTO keyword_settings (keyword, keyword_norm, is_active, created_at, updated_at)
-                VALUES (?, ?, 1, ?, ?)
-                ON CONFLICT(keyword_norm) DO UPDATE SET
-                  keyword = excluded.keyword,
-                  is_active = 1,
-                  updated_at = excluded.updated_at
-                """,
-                (keyword, normalized, now, now),
-            )
+        conn.executemany(
+            """
+            INSERT INTO keyword_settings (keyword, keyword_norm, is_active, created_at, updated_at)
+            VALUES (?, ?, 1, ?, ?)
+            ON CONFLICT(keyword_norm) DO UPDATE SET
+              keyword = excluded.keyword,
+              is_active = 1,
+              updated_at = excluded.updated_at
+            """,
+            rows,
+        )
         conn.commit()
 
 
@@ -666,22 +772,13 @@ def _list_keywords() -> List[dict]:
     with get_conn() as conn:
         cur = conn.execute(
             """
-            SELECT id, keyword, keyword_norm, is_active, updated_at
+            SELECT id, keyword, is_active
             FROM keyword_settings
             ORDER BY id ASC
             """
         )
         rows = cur.fetchall()
-    return [
-        {
-            "id": row[0],
-            "keyword": row[1],
-            "keyword_norm": row[2],
-            "is_active": bool(row[3]),
-            "updated_at": row[4],
-        }
-        for row in rows
-    ]
+    return [{"id": row[0], "keyword": row[1], "is_active": bool(row[2])} for row in rows]
 
 
 def _active_keywords() -> List[dict]:
@@ -699,21 +796,15 @@ def _active_keywords() -> List[dict]:
 
 
 def _delete_keyword_articles(conn, keyword_norm: str) -> None:
-    cur = conn.execute(
+    conn.execute(
         """
-        SELECT id
-        FROM keyword_articles
-        WHERE keyword_norm = ?
+        DELETE FROM keyword_bookmarks
+        WHERE keyword_article_id IN (
+          SELECT id FROM keyword_articles WHERE keyword_norm = ?
+        )
         """,
         (keyword_norm,),
     )
-    ids = [row[0] for row in cur.fetchall()]
-    if ids:
-        placeholders = ",".join("?" for _ in ids)
-        conn.execute(
-            f"DELETE FROM keyword_bookmarks WHERE keyword_article_id IN ({placeholders})",
-            ids,
-        )
     conn.execute(
         """
         DELETE FROM keyword_articles
@@ -726,15 +817,16 @@ def _delete_keyword_articles(conn, keyword_norm: str) -> None:
 def _prune_unbookmarked_articles(days: int) -> int:
     if days <= 0:
         return 0
-    cutoff = (datetime.utcnow().date() - timedelta(days=days - 1)).isoformat()
+    cutoff = (datetime.now(timezone.utc).date() - timedelta(days=days - 1)).isoformat()
     with get_conn() as conn:
         cur = conn.execute(
             """
             DELETE FROM articles
-            WHERE id NOT IN (
-              SELECT article_id FROM bookmarks WHERE removed_at IS NULL
+            WHERE (published_at IS NULL OR published_at < ?)
+            AND NOT EXISTS (
+              SELECT 1 FROM bookmarks b
+              WHERE b.article_id = articles.id AND b.removed_at IS NULL
             )
-            AND (published_at IS NULL OR published_at < ?)
             """,
             (cutoff,),
         )
@@ -742,9 +834,147 @@ def _prune_unbookmarked_articles(days: int) -> int:
         return cur.rowcount or 0
 
 
-def _source_name_map() -> Dict[str, str]:
-    sources = load_sources()
-    return {str(s.get("id")): str(s.get("name")) for s in sources if s.get("id") and s.get("name")}
+def _sync_sources_table() -> None:
+    # Mirror sources.yaml (plus logos) into SQL so feed queries can join it.
+    rows = [
+        (str(s.get("id")), str(s.get("name")) if s.get("name") else None, _LOGO_URLS.get(str(s.get("id"))))
+        for s in load_sources()
+        if s.get("id")
+    ]
+    with get_conn() as conn:
+        conn.executemany(
+            """
+            INSERT INTO sources (id, name, logo_url)
+            VALUES (?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+              name = excluded.name,
+              logo_url = excluded.logo_url
+            """,
+            rows,
+        )
+        conn.commit()
+    # The ETags pick up the new names/logos; drop pages rendered with the old ones now.
+    with _page_cache_lock:
+        _page_cache.clear()
+
+
+def _check_etag(request: Request, response: Response, etag: str) -> Optional[Response]:
+    # Tag the outgoing response; hand back a bare 304 when the client already has it.
+    # no-cache, not max-age: /bookmarks is the redirect target after every
+    # bookmark write, so a fresh-for-N-seconds copy would show the old list.
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=dict(response.headers))
+    return None
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    candidates = request.headers.get("if-none-match", "")
+    return any(c.strip().removeprefix("W/") == etag for c in candidates.split(","))
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    # Needs an explicit gzip token; "gzip;q=0" means the client refuses it.
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        if coding.strip().lower() != "gzip":
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if q > 0:
+            return True
+    return False
+
+
+# Source names and logos are joined into every card, so both page ETags carry this too.
+_SOURCES_FINGERPRINT_SQL = """
+    SELECT IFNULL(group_concat(id || '|' || IFNULL(name, '') || '|' || IFNULL(logo_url, ''), ','), '')
+    FROM (SELECT id, name, logo_url FROM sources ORDER BY id)
+"""
+
+
+def _feed_etag(conn) -> str:
+    # Feed tables are insert/delete only, so row count + max id changes whenever the page would.
+    row = conn.execute(
+        f"""
+        SELECT (SELECT COUNT(*) FROM articles), (SELECT IFNULL(MAX(id), 0) FROM articles),
+               (SELECT COUNT(*) FROM keyword_articles), (SELECT IFNULL(MAX(id), 0) FROM keyword_articles),
+               ({_SOURCES_FINGERPRINT_SQL})
+        """
+    ).fetchone()
+    sources_version = hashlib.sha1(row[4].encode()).hexdigest()[:8]
+    return '"' + "-".join([_STYLES_VERSION, *map(str, row[:4]), sources_version]) + '"'
+
+
+def _bookmarks_etag(conn) -> str:
+    # Removal is a soft delete, so also track how many are live and the latest removal.
+    row = conn.execute(
+        """
+        SELECT COUNT(*), IFNULL(MAX(id), 0), IFNULL(SUM(removed_at IS NULL), 0), IFNULL(MAX(removed_at), '')
+        FROM bookmarks
+        UNION ALL
+        SELECT COUNT(*), IFNULL(MAX(id), 0), IFNULL(SUM(removed_at IS NULL), 0), IFNULL(MAX(removed_at), '')
+        FROM keyword_bookmarks
+        """
+    ).fetchall()
+    sources = conn.execute(_SOURCES_FINGERPRINT_SQL).fetchone()[0]
+    raw = "|".join(",".join(map(str, r)) for r in row) + "|" + sources
+    return '"' + _STYLES_VERSION + "-" + hashlib.sha1(raw.encode()).hexdigest()[:16] + '"'
+
+
+def _fetch_bookmark_rows(limit: int = 100) -> List[tuple]:
+    with get_conn() as conn:
+        cur = conn.execute(
+            """
+            SELECT b.id, b.source_id, b.title, b.url, b.summary, b.image_url, b.published_at,
+                   s.name, s.logo_url
+            FROM (
+              SELECT * FROM (
+                SELECT a.id AS id,
+                       a.title AS title,
+                       a.url AS url,
+                       a.summary AS summary,
+                       a.image_url AS image_url,
+                       a.published_at AS published_at,
+                       a.source_id AS source_id,
+                       b.created_at AS created_at
+                FROM bookmarks b
+                JOIN articles a ON a.id = b.article_id
+                WHERE b.removed_at IS NULL
+                ORDER BY b.created_at DESC
+                LIMIT ?
+              )
+              UNION ALL
+              SELECT * FROM (
+                SELECT k.id AS id,
+                       k.title AS title,
+                       k.url AS url,
+                       k.summary AS summary,
+                       k.image_url AS image_url,
+                       k.published_at AS published_at,
+                       'keyword_news' AS source_id,
+                       kb.created_at AS created_at
+                FROM keyword_bookmarks kb
+                JOIN keyword_articles k ON k.id = kb.keyword_article_id
+                WHERE kb.removed_at IS NULL
+                ORDER BY kb.created_at DESC
+                LIMIT ?
+              )
+            ) b
+            LEFT JOIN sources s ON s.id = b.source_id
+            ORDER BY b.created_at DESC
+            LIMIT ?
+            """,
+            (limit, limit, limit),
+        )
+        return cur.fetchall()
 
 
 def _fetch_feed_rows(limit: int = 50) -> List[tuple]:
@@ -753,29 +983,32 @@ def _fetch_feed_rows(limit: int = 50) -> List[tuple]:
         "i_boss": 3,
         "keyword_news": 3,
     }
+    # One round-trip: each table contributes its newest 200 via its feed index.
     with get_conn() as conn:
-        cur = conn.execute(
+        combined = conn.execute(
             """
-            SELECT id, source_id, title, url, summary, image_url, published_at
-            FROM articles
-            WHERE source_id IS NULL OR source_id != ?
-            ORDER BY published_at DESC, id DESC
-            LIMIT 200
+            SELECT * FROM (
+              SELECT a.id, a.source_id, a.title, a.url, a.summary, a.image_url, a.published_at,
+                     s.name, s.logo_url
+              FROM articles a
+              LEFT JOIN sources s ON s.id = a.source_id
+              WHERE a.source_id IS NULL OR a.source_id != ?
+              ORDER BY a.published_at DESC, a.id DESC
+              LIMIT 200
+            )
+            UNION ALL
+            SELECT * FROM (
+              SELECT k.id, 'keyword_news' AS source_id, k.title, k.url, k.summary, k.image_url, k.published_at,
+                     s.name, s.logo_url
+              FROM keyword_articles k
+              LEFT JOIN sources s ON s.id = 'keyword_news'
+              ORDER BY k.published_at DESC, k.id DESC
+              LIMIT 200
+            )
             """,
             ("keyword_news",),
-        )
-        article_rows = cur.fetchall()
-        cur = conn.execute(
-            """
-            SELECT id, 'keyword_news' AS source_id, title, url, summary, image_url, published_at
-            FROM keyword_articles
-            ORDER BY published_at DESC, id DESC
-            LIMIT 200
-            """
-        )
-        keyword_rows = cur.fetchall()
+        ).fetchall()
 
-    combined = list(article_rows) + list(keyword_rows)
     combined.sort(key=lambda r: (r[6] or "", r[0]), reverse=True)
 
     selected: list[tuple] = []
@@ -811,81 +1044,134 @@ def _fetch_feed_rows(limit: int = 50) -> List[tuple]:
     return selected
 
 
-def _display_source_name(source_id: Optional[str], url: str, source_names: Dict[str, str]) -> str:
-    if source_id and source_id in source_names:
-        return source_names[source_id]
-    domain = urlparse(url).netloc
-    return domain or (source_id or "")
+def _feed_card(row: tuple) -> str:
+    article_id, source_id = row[0], row[1]
+    action = f"/bookmark/{article_id}"
+    if source_id == "keyword_news":
+        action = f"/keyword-bookmark/{article_id}"
+    return _render_card(
+        row,
+        f'<form class="bookmark" method="post" action="{action}"><button type="submit">찜</button></form>',
+    )
 
 
-def _source_logo_url(source_id: Optional[str]) -> Optional[str]:
-    if source_id == "yozm_it":
-        return "https://upload.wikimedia.org/wikipedia/commons/9/92/%EC%9A%94%EC%A6%98IT_%EB%A1%9C%EA%B3%A0.png"
-    if source_id == "i_boss":
-        return "https://cdn.ibos.kr/images/iboss_home_logo.svg"
+def _bookmark_card(row: tuple) -> str:
+    article_id, source_id = row[0], row[1]
+    action = f"/bookmark/{article_id}/remove"
     if source_id == "keyword_news":
-        return "https://www.gstatic.com/images/branding/product/1x/googleg_32dp.png"
-    return None
+        action = f"/keyword-bookmark/{article_id}/remove"
+    return _render_card(
+        row,
+        f'<form class="bookmark" method="post" action="{action}"><button type="submit">제거</button></form>',
+    )
 
 
-def _is_recommended(title: str, summary: str, tags: List[str]) -> bool:
-    text = f"{title} {summary}".lower()
-    pm_keywords = [
-        "기획",
-        "프로덕트",
-        "product",
-        "pm",
-        "po",
-        "로드맵",
-        "roadmap",
-        "전략",
-        "launch",
-        "strategy",
-        "okr",
-        "고객",
-        "customer",
-        "지표",
-        "metric",
-        "실험",
-        "experiment",
-    ]
-    if any(tag in ["기획", "프로덕트", "비즈니스", "트렌드"] for tag in tags):
-        return True
-    return any(k in text for k in pm_keywords)
+@lru_cache(maxsize=1024)
+def _render_card(row: tuple, action_html: str) -> str:
+    """Render one feed row: (id, source_id, title, url, summary, image_url,
+    published_at, source_name, logo_url).
 
+    Rows are plain tuples of stored values, so the finished markup is
+    memoized; repeat page views reuse it instead of re-formatting.
+    """
+    _, source_id, title, url, summary, image_url, published_at, source_name, logo_url = row
+    tags, recommended = _classify(title, summary, source_id)
+    # Stored strings come from third-party pages; escape each one exactly once here.
+    raw_label = _display_source_name(source_id, url, source_name)
+    source_label = escape(raw_label)
+    title = escape(title)
+    url = escape(url)
+    summary = escape(summary or "")
+    published_at = escape(published_at or "")
+    tags_html = "".join(f'<span class="tag">{tag}</span>' for tag in tags)
+    rec_html = '<span class="badge">추천</span>' if recommended else ""
+    avatar_html = _render_avatar(raw_label, logo_url)
+    if image_url:
+        media_html = (
+            '<div class="media">'
+            f'<img src="{escape(image_url)}" alt="" loading="lazy" '
+            'onerror="this.parentElement.classList.add(\'is-broken\');" />'
+            f'<div class="media__ph">{source_label}</div>'
+            "</div>"
+        )
+    else:
+        media_html = _render_media_placeholder(raw_label)
+    return f"""
+            <article class="card">
+              <header class="card__header">
+                {avatar_html}
+                <div class="meta">
+                  <div class="source">{source_label}</div>
+                  <div class="date">{published_at}</div>
+                </div>
+                {action_html}
+              </header>
+              <div class="tags">{tags_html}{rec_html}</div>
+              <h2 class="title">
+                <a href="{url}" target="_blank" rel="noopener noreferrer">{title}</a>
+              </h2>
+              <p class="summary">{summary}</p>
+              {media_html}
+            </article>
+            """
 
-def _infer_tags(title: str, summary: str, source_id: Optional[str]) -> List[str]:
-    if source_id == "keyword_news":
-        return ["키워드"]
+
+# A handful of sources share these, so each variant is formatted once.
+@lru_cache(maxsize=256)
+def _render_avatar(raw_label: str, logo_url: Optional[str]) -> str:
+    initial = escape(raw_label[:1].upper() or "?")
+    if not logo_url:
+        return f'<div class="avatar avatar--placeholder" aria-hidden="true">{initial}</div>'
+    return (
+        '<div class="logo-wrap">'
+        f'<img class="logo" src="{escape(logo_url)}" alt="{escape(raw_label)} logo" loading="lazy" '
+        'onerror="this.parentElement.classList.add(\'is-broken\');" />'
+        f'<div class="logo-fallback">{initial}</div>'
+        "</div>"
+    )
+
+
+@lru_cache(maxsize=256)
+def _render_media_placeholder(raw_label: str) -> str:
+    return f'<div class="media media--placeholder">{escape(raw_label)}</div>'
+
+
+def _display_source_name(source_id: Optional[str], url: str, source_name: Optional[str]) -> str:
+    if source_name:
+        return source_name
+    match = _NETLOC_RE.match(url)
+    return (match.group(1) if match else "") or (source_id or "")
+
+
+@lru_cache(maxsize=4096)
+def _classify(title: str, summary: str, source_id: Optional[str]) -> Tuple[Tuple[str, ...], bool]:
+    """Return (tags, recommended) for a card, lowering the text only once.
+
+    Article text is immutable once stored, so results are memoized; tags are
+    returned as a tuple to keep cached values immutable.
+    """
     text = f"{title} {summary}".lower()
-    tag_keywords = {
-        "기획": ["기획", "plan", "planning", "pm", "po", "roadmap", "strategy", "okr"],
-        "디자인": ["디자인", "ux", "ui", "design", "prototype"],
-        "개발": ["개발", "dev", "engineering", "code", "backend", "frontend", "api"],
-        "AI": ["ai", "llm", "model", "inference", "agent"],
-        "마케팅": ["마케팅", "marketing", "ad", "campaign", "brand", "performance"],
-        "비즈니스": ["비즈니스", "business", "b2b", "b2c", "revenue", "growth"],
-        "프로덕트": ["프로덕트", "product", "feature", "launch", "retention", "activation"],
-        "커리어": ["커리어", "career", "hiring", "interview", "leadership"],
-        "트렌드": ["트렌드", "trend", "market", "outlook", "report"],
-        "스타트업": ["스타트업", "startup", "founder", "seed", "venture"],
-    }
+    if source_id == "keyword_news":
+        return ("키워드",), bool(_PM_KEYWORD_PATTERN.search(text))
 
     tags: List[str] = []
     if source_id == "i_boss":
         tags.append("마케팅")
 
-    for tag, keywords in tag_keywords.items():
+    for tag, pattern in _TAG_PATTERNS:
         if tag in tags:
             continue
-        if any(k in text for k in keywords):
+        if pattern.search(text):
             tags.append(tag)
         if len(tags) >= 3:
             break
 
     if not tags:
         tags.append("기획")
-    return tags
+
+    if not _RECOMMENDED_TAGS.isdisjoint(tags):
+        return tuple(tags), True
+    return tuple(tags), bool(_PM_KEYWORD_PATTERN.search(text))
 
 
 def _po_pm_trend_items() -> List[Dict[str, str]]:
@@ -990,24 +1276,28 @@ def _render_trend_bar(
     limit: int = 5,
     track_class: str = "",
 ) -> str:
-    rows = []
-    for item in items[:limit]:
-        rows.append(
+    def render_items(copy_attrs: str, link_attrs: str) -> str:
+        if not items:
+            return f'<li class="trend__item"{copy_attrs}>No items</li>'
+        return "".join(
             f"""
-            <li class="trend__item">
-              <span class="trend__meta">{item["source"]} | {item["date"]}</span>
-              <a href="{item["url"]}" target="_blank" rel="noopener noreferrer">{item["title"]}</a>
+            <li class="trend__item"{copy_attrs}>
+              <span class="trend__meta">{escape(item["source"])} | {escape(item["date"])}</span>
+              <a href="{escape(item["url"])}" target="_blank" rel="noopener noreferrer"{link_attrs}>{escape(item["title"])}</a>
             </li>
             """
+            for item in items[:limit]
         )
-    body = "\n".join(rows) if rows else '<li class="trend__item">No items</li>'
+
+    # The marquee needs a second copy to wrap seamlessly (translateX(-50%));
+    # hide that copy from screen readers and keyboard focus.
     return f"""
       <div class="trend">
-        <div class="trend__label">{label}</div>
+        <div class="trend__label">{escape(label)}</div>
         <div class="trend__viewport">
           <ul class="trend__track {track_class}">
-            {body}
-            {body}
+            {render_items("", "")}
+            {render_items(' aria-hidden="true"', ' tabindex="-1"')}
           </ul>
         </div>
       </div>
@@ -1021,6 +1311,12 @@ def _render_trend_bars() -> str:
     )
     po_pm_html = _render_trend_bar("PO/PM 추천 트렌드", _po_pm_trend_items(), limit=5)
     return f"{martech_html}\n{po_pm_html}"
+
+
+# Trend items are static, so the bars are rendered once at import.
+_TREND_BARS_HTML = _render_trend_bars()
+
+
 @app.post("/bookmark/{article_id}")
 def add_bookmark(article_id: int) -> RedirectResponse:
     with get_conn() as conn:
@@ -1030,7 +1326,7 @@ def add_bookmark(article_id: int) -> RedirectResponse:
             VALUES (?, ?)
             ON CONFLICT(article_id) DO UPDATE SET removed_at = NULL
             """,
-            (article_id, datetime.utcnow().isoformat()),
+            (article_id, _utc_now_iso()),
         )
         conn.commit()
     return RedirectResponse(url="/bookmarks", status_code=303)
@@ -1050,7 +1346,7 @@ def add_keyword_bookmark(keyword_article_id: int) -> RedirectResponse:
             VALUES (?, ?)
             ON CONFLICT(keyword_article_id) DO UPDATE SET removed_at = NULL
             """,
-            (keyword_article_id, datetime.utcnow().isoformat()),
+            (keyword_article_id, _utc_now_iso()),
         )
         conn.commit()
     return RedirectResponse(url="/bookmarks", status_code=303)
@@ -1068,7 +1364,7 @@ def remove_bookmark(article_id: int) -> RedirectResponse:
             SET removed_at = ?
             WHERE article_id = ?
             """,
-            (datetime.utcnow().isoformat(), article_id),
+            (_utc_now_iso(), article_id),
         )
         conn.commit()
     return RedirectResponse(url="/bookmarks", status_code=303)
@@ -1083,386 +1379,7 @@ def remove_keyword_bookmark(keyword_article_id: int) -> RedirectResponse:
             SET removed_at = ?
             WHERE keyword_article_id = ?
             """,
-            (datetime.utcnow().isoformat(), keyword_article_id),
+            (_utc_now_iso(), keyword_article_id),
         )
         conn.commit()
     return RedirectResponse(url="/bookmarks", status_code=303)
-def _inline_shared_styles() -> str:
-    return """
-          :root {
-            --bg: #f9fafb;
-            --card: #ffffff;
-            --text: #191f28;
-            --muted: #6b7684;
-            --border: #e5e8eb;
-            --accent: #3182f6;
-            --accent-soft: #e8f3ff;
-          }
-          * { box-sizing: border-box; }
-          body {
-            margin: 0;
-            font-family: "SUIT", "Pretendard", "Noto Sans KR", "Segoe UI", sans-serif;
-            color: var(--text);
-            background: var(--bg);
-          }
-          .topbar {
-            background: #ffffff;
-            border-bottom: 1px solid var(--border);
-            padding: 12px 24px;
-            position: sticky;
-            top: 0;
-            z-index: 10;
-          }
-          .menu {
-            display: flex;
-            gap: 16px;
-            list-style: none;
-            margin: 0;
-            padding: 0;
-            font-weight: 600;
-          }
-          .menu li {
-            padding: 8px 12px;
-            border-radius: 8px;
-            color: var(--muted);
-          }
-          .menu li.active {
-            color: var(--accent);
-            background: var(--accent-soft);
-          }
-          .menu a {
-            color: inherit;
-            text-decoration: none;
-          }
-          .container {
-            max-width: 1200px;
-            margin: 24px auto 64px;
-            padding: 0 24px;
-          }
-          .trend {
-            background: var(--card);
-            border: 1px solid var(--border);
-            border-radius: 12px;
-            padding: 10px 12px;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.04);
-            display: grid;
-            grid-template-columns: 140px 1fr;
-            gap: 12px;
-            align-items: center;
-            margin-bottom: 16px;
-          }
-          .trend__label {
-            font-weight: 700;
-            color: var(--accent);
-            font-size: 13px;
-            white-space: nowrap;
-          }
-          .trend__viewport {
-            overflow: hidden;
-          }
-          .trend__track {
-            list-style: none;
-            margin: 0;
-            padding: 0;
-            display: flex;
-            gap: 24px;
-            width: max-content;
-            animation: trend-scroll 28s linear infinite;
-          }
-          .trend__track--martech {
-            animation-duration: 56s;
-          }
-          .trend__item {
-            display: inline-flex;
-            gap: 8px;
-            align-items: center;
-            white-space: nowrap;
-          }
-          .trend__item a {
-            color: var(--text);
-            text-decoration: none;
-            font-weight: 600;
-            font-size: 13px;
-          }
-          .trend__item a:hover {
-            text-decoration: underline;
-          }
-          .trend__meta {
-            color: var(--muted);
-            font-size: 12px;
-          }
-          @keyframes trend-scroll {
-            from { transform: translateX(0); }
-            to { transform: translateX(-50%); }
-          }
-          .grid {
-            display: grid;
-            grid-template-columns: repeat(3, minmax(0, 1fr));
-            gap: 16px;
-          }
-          .card {
-            background: var(--card);
-            border: 1px solid var(--border);
-            border-radius: 12px;
-            padding: 16px;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-            display: flex;
-            flex-direction: column;
-            gap: 10px;
-          }
-          .card__header {
-            display: flex;
-            gap: 10px;
-            align-items: center;
-          }
-          .avatar {
-            width: 40px;
-            height: 40px;
-            border-radius: 50%;
-            background: var(--accent);
-            color: #ffffff;
-            display: grid;
-            place-items: center;
-            font-weight: 700;
-          }
-          .avatar--placeholder {
-            background: linear-gradient(135deg, #3182f6, #63a4ff);
-          }
-          .logo-wrap {
-            width: 40px;
-            height: 40px;
-            border-radius: 8px;
-            background: #ffffff;
-            border: 1px solid var(--border);
-            display: grid;
-            place-items: center;
-            overflow: hidden;
-            position: relative;
-          }
-          .logo {
-            width: 40px;
-            height: 40px;
-            object-fit: contain;
-            padding: 4px;
-            z-index: 1;
-          }
-          .logo-fallback {
-            position: absolute;
-            inset: 0;
-            display: grid;
-            place-items: center;
-            background: linear-gradient(135deg, #e8f3ff, #f9fafb);
-            color: var(--accent);
-            font-weight: 700;
-          }
-          .logo-wrap.is-broken .logo {
-            display: none;
-          }
-          .bookmark {
-            margin-left: auto;
-          }
-          .bookmark button {
-            border: 1px solid var(--border);
-            background: #ffffff;
-            color: var(--accent);
-            padding: 6px 10px;
-            border-radius: 999px;
-            font-weight: 600;
-            cursor: pointer;
-          }
-          .bookmark button:hover {
-            background: var(--accent-soft);
-          }
-          .meta .source {
-            font-weight: 700;
-          }
-          .meta .date {
-            font-size: 12px;
-            color: var(--muted);
-          }
-          .tags {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 6px;
-          }
-          .tag {
-            display: inline-flex;
-            align-items: center;
-            padding: 4px 8px;
-            border-radius: 999px;
-            background: var(--accent-soft);
-            color: var(--accent);
-            font-size: 12px;
-            font-weight: 600;
-          }
-          .badge {
-            display: inline-flex;
-            align-items: center;
-            padding: 4px 8px;
-            border-radius: 999px;
-            background: #e8f3ff;
-            color: #1b64da;
-            font-size: 12px;
-            font-weight: 700;
-          }
-          .title {
-            margin: 0;
-            font-size: 16px;
-            line-height: 1.4;
-          }
-          .title a {
-            color: var(--text);
-            text-decoration: none;
-          }
-          .title a:hover {
-            text-decoration: underline;
-          }
-          .summary {
-            margin: 0;
-            color: var(--text);
-            font-size: 14px;
-            line-height: 1.5;
-          }
-          .media {
-            position: relative;
-          }
-          .media img {
-            width: 100%;
-            height: 180px;
-            object-fit: cover;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-            position: relative;
-            z-index: 1;
-            background: #ffffff;
-          }
-          .media__ph {
-            position: absolute;
-            inset: 0;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-            background: linear-gradient(135deg, #e8f3ff, #f9fafb);
-            color: var(--accent);
-            font-weight: 700;
-            display: grid;
-            place-items: center;
-          }
-          .media.is-broken img {
-            display: none;
-          }
-          .media.is-broken .media__ph {
-            position: static;
-            height: 180px;
-          }
-          .media--placeholder {
-            width: 100%;
-            height: 180px;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-            background: linear-gradient(135deg, #e8f3ff, #f9fafb);
-            color: var(--accent);
-            font-weight: 700;
-            display: grid;
-            place-items: center;
-          }
-          .empty {
-            color: var(--muted);
-          }
-          .panel {
-            background: var(--card);
-            border: 1px solid var(--border);
-            border-radius: 12px;
-            padding: 20px;
-            box-shadow: 0 1px 2px rgba(0,0,0,0.04);
-          }
-          .panel h2 {
-            margin: 0 0 12px;
-            font-size: 18px;
-          }
-          .panel h3 {
-            margin: 20px 0 10px;
-            font-size: 14px;
-            color: var(--muted);
-          }
-          .panel h3.mt {
-            margin-top: 24px;
-          }
-          .keyword-form {
-            display: flex;
-            gap: 8px;
-            margin-bottom: 8px;
-          }
-          .keyword-form input {
-            flex: 1;
-            padding: 10px 12px;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-            font-size: 14px;
-          }
-          .keyword-form button {
-            border: 1px solid var(--border);
-            background: var(--accent);
-            color: #ffffff;
-            padding: 8px 14px;
-            border-radius: 8px;
-            font-weight: 700;
-            cursor: pointer;
-          }
-          .keyword-list {
-            list-style: none;
-            padding: 0;
-            margin: 0;
-            display: flex;
-            flex-direction: column;
-            gap: 8px;
-          }
-          .keyword-item {
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-            border: 1px solid var(--border);
-            border-radius: 10px;
-            padding: 8px 12px;
-            background: #ffffff;
-          }
-          .keyword-text {
-            font-weight: 600;
-          }
-          .keyword-item button {
-            border: 1px solid var(--border);
-            background: #ffffff;
-            color: var(--accent);
-            padding: 6px 10px;
-            border-radius: 999px;
-            font-weight: 600;
-            cursor: pointer;
-          }
-          .btn-link {
-            display: inline-flex;
-            align-items: center;
-            justify-content: center;
-            padding: 8px 14px;
-            border-radius: 8px;
-            border: 1px solid var(--border);
-            background: #ffffff;
-            color: var(--accent);
-            font-weight: 700;
-            text-decoration: none;
-            margin-bottom: 8px;
-          }
-          @media (max-width: 1024px) {
-            .grid {
-              grid-template-columns: repeat(2, minmax(0, 1fr));
-            }
-            .trend {
-              grid-template-columns: 1fr;
-              gap: 6px;
-            }
-          }
-          @media (max-width: 768px) {
-            .grid {
-              grid-template-columns: 1fr;
-            }
-          }
-    """
-
@@ -3,7 +3,7 @@ from datetime import datetime
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     id: Optional[int]
     title: str
@@ -12,7 +12,7 @@ class Article:
     published_at: Optional[datetime]
 
 
-@dataclass
+@dataclass(slots=True)
 class Feedback:
     id: Optional[int]
     article_id: int
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List
 
@@ -8,15 +9,26 @@ import yaml
 
 _ROOT = Path(__file__).resolve().parent.parent
 _DEFAULT_SOURCES_PATH = _ROOT / "sources.yaml"
+# libyaml's C loader when PyYAML was built with it; same safe subset either way.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def load_sources(path: Path | None = None) -> List[dict]:
+    # Parsed once per file version; callers must treat the result as read-only.
+    return _load_sources_cached(*_sources_version(path))
+
+
+def _sources_version(path: Path | None) -> tuple[Path, int]:
     sources_path = path or _DEFAULT_SOURCES_PATH
     if not sources_path.exists():
         raise FileNotFoundError(f"sources.yaml not found: {sources_path}")
+    return sources_path, sources_path.stat().st_mtime_ns
+
 
+@lru_cache(maxsize=8)
+def _load_sources_cached(sources_path: Path, mtime_ns: int) -> List[dict]:
     with sources_path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_YAML_LOADER) or {}
 
     sources = data.get("sources") or []
     if not isinstance(sources, list):
@@ -24,8 +36,17 @@ def load_sources(path: Path | None = None) -> List[dict]:
     return sources
 
 
+@lru_cache(maxsize=8)
+def _source_index(sources_path: Path, mtime_ns: int) -> Dict[str, dict]:
+    index: Dict[str, dict] = {}
+    for source in _load_sources_cached(sources_path, mtime_ns):
+        # First entry wins, as with the old linear scan.
+        index.setdefault(source.get("id"), source)
+    return index
+
+
 def get_source_by_id(source_id: str, path: Path | None = None) -> Dict:
-    for source in load_sources(path):
-        if source.get("id") == source_id:
-            return source
-    raise KeyError(f"source_id not found: {source_id}")
+    source = _source_index(*_sources_version(path)).get(source_id)
+    if source is None:
+        raise KeyError(f"source_id not found: {source_id}")
+    return source
@@ -3,14 +3,23 @@ from __future__ import annotations
 import argparse
 import json
 import re
+from concurrent.futures import ThreadPoolExecutor
 from http.cookiejar import CookieJar
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from urllib.parse import urljoin
 
+import lxml  # noqa: F401  # BeautifulSoup(..., "lxml") needs it; fail at import, not mid-export
 import requests
 from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+_RE_DATE = re.compile(r"\b(\d{4})\s*\.\s*(\d{2})\s*\.\s*(\d{2})\b")
+_RE_IBOSS_CATEGORY = re.compile(r"/ab-(\d+)")
+_RE_IBOSS_ANY_ARTICLE = re.compile(r"/ab-\d+-\d+")
+_FETCH_WORKERS = 8
 
 
 def _load_cookies(path: Path) -> CookieJar:
@@ -37,48 +46,81 @@ def _load_cookies(path: Path) -> CookieJar:
     return jar
 
 
-def fetch_html(url: str, timeout: int = 20, *, cookies_path: Path | None = None) -> str:
-    headers = {"User-Agent": "Mozilla/5.0 (compatible; yong2-local/0.1)"}
+def _build_session(cookies_path: Path | None = None) -> requests.Session:
+    # Sized so every fetch worker can hold a keep-alive connection to i-boss.
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=_FETCH_WORKERS, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
     session.trust_env = False
+    session.headers.update({"User-Agent": "Mozilla/5.0 (compatible; yong2-local/0.1)"})
     if cookies_path:
         session.cookies = _load_cookies(cookies_path)
-    resp = session.get(
-        url,
-        headers=headers,
-        timeout=timeout,
-    )
+    return session
+
+
+def fetch_html(
+    url: str,
+    timeout: int = 20,
+    *,
+    cookies_path: Path | None = None,
+    session: requests.Session | None = None,
+) -> str:
+    session = session or _build_session(cookies_path)
+    resp = session.get(url, timeout=timeout)
     resp.raise_for_status()
     return resp.text
 
 
-def meta_content(soup: BeautifulSoup, key: str) -> Optional[str]:
-    if key.startswith("og:") or key.startswith("twitter:"):
-        tag = soup.find("meta", property=key)
-    else:
-        tag = soup.find("meta", attrs={"name": key})
-    if tag and tag.get("content"):
-        return str(tag.get("content")).strip()
-    return None
+def meta_map(soup: BeautifulSoup) -> dict[str, str]:
+    # Single pass over <meta> tags. og:/twitter: keys come from `property`,
+    # everything else from `name`.
+    metas: dict[str, str] = {}
+    for tag in soup.find_all("meta"):
+        content = str(tag.get("content") or "").strip()
+        if not content:
+            continue
+        prop = tag.get("property") or ""
+        if prop.startswith(("og:", "twitter:")):
+            metas.setdefault(prop, content)
+        name = tag.get("name")
+        if name and not name.startswith(("og:", "twitter:")):
+            metas.setdefault(name, content)
+    return metas
 
 
 def parse_date(text: str) -> Optional[str]:
-    match = re.search(r"\b(\d{4})\s*\.\s*(\d{2})\s*\.\s*(\d{2})\b", text or "")
+    match = _RE_DATE.search(text or "")
     if not match:
         return None
     return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
 
 
+def find_page_date(soup: BeautifulSoup) -> Optional[str]:
+    # Same first match as parse_date(soup.get_text(" ", strip=True)), but stops
+    # at the first date instead of joining the whole page. A short tail of the
+    # previous string is carried over for dates split across text nodes.
+    tail = ""
+    for text in soup.stripped_strings:
+        window = f"{tail} {text}" if tail else text
+        published_at = parse_date(window)
+        if published_at:
+            return published_at
+        tail = window[-32:]
+    return None
+
+
+@lru_cache(maxsize=32)
 def _iboss_article_pattern(start_url: str) -> re.Pattern:
-    match = re.search(r"/ab-(\d+)", start_url)
+    match = _RE_IBOSS_CATEGORY.search(start_url)
     if match:
         category = match.group(1)
         return re.compile(rf"/ab-{category}-\d+")
-    return re.compile(r"/ab-\d+-\d+")
+    return _RE_IBOSS_ANY_ARTICLE
 
 
 def extract_links(list_html: str, base_url: str, limit: int) -> list[str]:
-    soup = BeautifulSoup(list_html, "html.parser")
+    soup = BeautifulSoup(list_html, "lxml")
     seen = set()
     links: list[str] = []
     pattern = _iboss_article_pattern(base_url)
@@ -96,18 +138,26 @@ def extract_links(list_html: str, base_url: str, limit: int) -> list[str]:
     return links
 
 
-def extract_article(url: str, *, cookies_path: Path | None = None) -> dict:
-    html = fetch_html(url, cookies_path=cookies_path)
-    soup = BeautifulSoup(html, "html.parser")
+def extract_article(
+    url: str,
+    *,
+    cookies_path: Path | None = None,
+    session: requests.Session | None = None,
+) -> dict:
+    html = fetch_html(url, cookies_path=cookies_path, session=session)
+    soup = BeautifulSoup(html, "lxml")
+
+    metas = meta_map(soup)
+    h1 = soup.find("h1")
 
     title = (
-        meta_content(soup, "og:title")
-        or meta_content(soup, "twitter:title")
-        or (soup.find("h1").get_text(" ", strip=True) if soup.find("h1") else "")
+        metas.get("og:title")
+        or metas.get("twitter:title")
+        or (h1.get_text(" ", strip=True) if h1 else "")
     )
-    summary = meta_content(soup, "description") or meta_content(soup, "og:description") or ""
-    image_url = meta_content(soup, "og:image") or meta_content(soup, "twitter:image")
-    published_at = parse_date(soup.get_text(" ", strip=True))
+    summary = metas.get("description") or metas.get("og:description") or ""
+    image_url = metas.get("og:image") or metas.get("twitter:image")
+    published_at = find_page_date(soup)
 
     return {
         "source_id": "i_boss",
@@ -120,18 +170,24 @@ def extract_article(url: str, *, cookies_path: Path | None = None) -> dict:
 
 
 def run(start_url: str, out_path: Path, limit: int, *, cookies_path: Path | None = None) -> int:
-    list_html = fetch_html(start_url, cookies_path=cookies_path)
+    # One session for the whole export: cookies load once and connections are reused.
+    session = _build_session(cookies_path)
+    list_html = fetch_html(start_url, session=session)
     links = extract_links(list_html, start_url, limit=limit)
 
-    items = []
-    for link in links:
+    def safe_extract(link: str) -> Optional[dict]:
         try:
-            item = extract_article(link, cookies_path=cookies_path)
+            return extract_article(link, session=session)
         except Exception:
-            continue
-        if not item["title"] or not item["url"]:
-            continue
-        items.append(item)
+            return None
+
+    # Article pages are independent fetches; map keeps the listing order.
+    with ThreadPoolExecutor(max_workers=_FETCH_WORKERS) as pool:
+        items = [
+            item
+            for item in pool.map(safe_extract, links)
+            if item and item["title"] and item["url"]
+        ]
 
     payload = {
         "generated_at": datetime.utcnow().isoformat(),